@@ -0,0 +1,137 @@
+'''
+Micro-benchmark of every registered calibration curve.
+
+For each curve in the muxer and LS370 _all_calibrations and plc.mother_dewar_lhe, times scalar
+calls and batch (CalibrationCurve.evaluate) conversions for readings inside the table range and
+for readings extrapolated past either end, and measures the memory allocated per conversion.
+
+usage: python benchmarks/calibration_benchmark.py [--scalar N] [--batch N] [--match REGEX] [--json FILE]
+'''
+
+import argparse
+import json
+import logging
+import re
+import time
+import tracemalloc
+
+import numpy as np
+
+from dripline.extensions import muxer_service, ls370, plc
+
+
+def all_curves():
+    curves = []
+    for source, calibrations in (('muxer', muxer_service._all_calibrations),
+                                 ('ls370', ls370._all_calibrations),
+                                 ('plc', [plc.mother_dewar_lhe])):
+        curves += [(source, a_curve) for a_curve in calibrations]
+    return curves
+
+
+def sample_inputs(curve, n, rng):
+    '''in-range and extrapolated raw values for a curve, drawn uniformly in its interpolation space'''
+    curve.load()
+    low, high = curve._x_array[0], curve._x_array[-1]
+    width = high - low
+    in_range = rng.uniform(low, high, n)
+    extrapolated = np.concatenate([rng.uniform(low - 0.5 * width, low, n // 2),
+                                   rng.uniform(high, high + 0.5 * width, n - n // 2)])
+    if curve.log_x:
+        in_range = np.exp(in_range)
+        extrapolated = np.exp(extrapolated)
+    return in_range, extrapolated
+
+
+def time_scalar(curve, values):
+    values = values.tolist()
+    start = time.perf_counter_ns()
+    for a_value in values:
+        curve(a_value)
+    return (time.perf_counter_ns() - start) / len(values)
+
+
+def time_batch(curve, values, repeats=5):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        curve.evaluate(values)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(values)
+
+
+def scalar_bytes(curve, values):
+    '''
+    peak bytes allocated over the same loop as time_scalar, per call; the results are kept so each
+    call's returned float counts, not only the transient peak of a single call
+    '''
+    values = values.tolist()
+    results = [None] * len(values)
+    tracemalloc.start()
+    for i, a_value in enumerate(values):
+        results[i] = curve(a_value)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / len(values)
+
+
+def batch_bytes(curve, values):
+    '''peak bytes allocated by one CalibrationCurve.evaluate of values, per element'''
+    tracemalloc.start()
+    curve.evaluate(values)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / len(values)
+
+
+def run(n_scalar, n_batch, match=None, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for source, curve in all_curves():
+        if match is not None and not re.search(match, curve.__name__):
+            continue
+        scalar_in, scalar_out = sample_inputs(curve, n_scalar, rng)
+        batch_in, batch_out = sample_inputs(curve, n_batch, rng)
+        results.append({
+            'source': source,
+            'name': curve.__name__,
+            'points': len(curve._x_array),
+            'scalar_ns': time_scalar(curve, scalar_in),
+            'scalar_extrapolated_ns': time_scalar(curve, scalar_out),
+            'batch_ns': time_batch(curve, batch_in),
+            'batch_extrapolated_ns': time_batch(curve, batch_out),
+            'scalar_bytes': scalar_bytes(curve, scalar_in),
+            'batch_bytes': batch_bytes(curve, batch_in),
+        })
+    return results
+
+
+def print_table(results):
+    header = f"{'curve':<30} {'pts':>4} {'scalar ns':>10} {'extrap ns':>10} {'batch ns':>9} {'extrap ns':>10} {'B/call':>7} {'B/elem':>7}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['source'] + '.' + r['name']:<30} {r['points']:>4} {r['scalar_ns']:>10.0f} {r['scalar_extrapolated_ns']:>10.0f}"
+              f" {r['batch_ns']:>9.1f} {r['batch_extrapolated_ns']:>10.1f} {r['scalar_bytes']:>7.1f} {r['batch_bytes']:>7.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--scalar', type=int, default=20000, help='number of scalar conversions per curve and range')
+    parser.add_argument('--batch', type=int, default=100000, help='array size for batch conversions')
+    parser.add_argument('--match', default=None, help='only benchmark curves whose name matches this regex')
+    parser.add_argument('--json', default=None, help='also write the results to this file')
+    args = parser.parse_args()
+
+    # extrapolation warnings would otherwise dominate (and flood) the extrapolated timings
+    logging.getLogger('sagebrush.functions').setLevel(logging.ERROR)
+    results = run(args.scalar, args.batch, args.match)
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
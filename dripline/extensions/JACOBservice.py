@@ -1,9 +1,12 @@
+import asyncio
+import itertools
 import re
 import socket
 import threading
 import time
 
 from dripline.core import Service, ThrowReply, Entity, calibrate
+from sagebrush.functions import SingleFlight, CachedGetMixin, single_flight, cached_get
 
 import logging
 logger = logging.getLogger(__name__)
@@ -11,7 +14,7 @@ logger = logging.getLogger(__name__)
 __all__ = []
 
 __all__.append('JACOBEntity')
-class JACOBEntity(Entity):
+class JACOBEntity(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -19,13 +22,14 @@ class JACOBEntity(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
             self.cmd_str = cmd_str
 
     """ Will return just the whole response as a vector of strings"""
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -33,7 +37,7 @@ class JACOBEntity(Entity):
         return result
 
 __all__.append('JACOBTemperature')
-class JACOBTemperature(Entity):
+class JACOBTemperature(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -41,7 +45,7 @@ class JACOBTemperature(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
@@ -55,6 +59,8 @@ class JACOBTemperature(Entity):
     0 = Status (See Status Summary)
     """
 
+    @cached_get
+    @single_flight
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -65,7 +71,7 @@ class JACOBTemperature(Entity):
         return result[1] # return the temperature in Kelvin
 
 __all__.append('JACOBPressure')
-class JACOBPressure(Entity):
+class JACOBPressure(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -73,7 +79,7 @@ class JACOBPressure(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
@@ -87,6 +93,7 @@ class JACOBPressure(Entity):
     0 = Status (See Status Summary
     """
 
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -98,7 +105,7 @@ class JACOBPressure(Entity):
         return result[1] # return the pressure in mbar
     
 __all__.append('JACOBHeater')
-class JACOBHeater(Entity):
+class JACOBHeater(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -106,7 +113,7 @@ class JACOBHeater(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
@@ -127,6 +134,7 @@ to the units of power: no letter – W, m – mW, u – uW, n - nW
         else:
             return float(power)
         
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -138,7 +146,7 @@ to the units of power: no letter – W, m – mW, u – uW, n - nW
         return self.correct_power(result[0]) # return the heater power value with units letter
     
 __all__.append('JACOBValve')
-class JACOBValve(Entity):
+class JACOBValve(CachedGetMixin, Entity):
     def __init__(self,
                     cmd_str=None,
                     **kwargs):
@@ -146,7 +154,7 @@ class JACOBValve(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
@@ -156,6 +164,7 @@ class JACOBValve(Entity):
        0 = the status of V1 (1 = Open, 0 = Closed)
        11:41:46.816 06/13/2014 = The time the command was sent
        0 = Status (See Status Summary)"""
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -169,7 +178,7 @@ class JACOBValve(Entity):
         return result[0] # return the valve status (0=closed, 1=open)
 
 __all__.append('JACOBPumpStatus')
-class JACOBPumpStatus(Entity):
+class JACOBPumpStatus(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -177,12 +186,13 @@ class JACOBPumpStatus(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
             self.cmd_str = cmd_str
     """ This isn't documented in the manual, but the command is getPumpState(0)"""
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -195,7 +205,7 @@ class JACOBPumpStatus(Entity):
         return result.split(',')[0] # return the pump status (0=stopped, 1=running?)
 
 __all__.append('JACOBPumpWarn')
-class JACOBPumpWarn(Entity):
+class JACOBPumpWarn(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -203,12 +213,13 @@ class JACOBPumpWarn(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
             self.cmd_str = cmd_str
     """ This isn't documented in the manual, but the command is getPumpState(0)"""
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -221,7 +232,7 @@ class JACOBPumpWarn(Entity):
         return result.split(',')[1] # return the pump status (0=stopped, 1=running?)
 
 __all__.append('JACOBPumpError')
-class JACOBPumpError(Entity):
+class JACOBPumpError(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -229,12 +240,13 @@ class JACOBPumpError(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
             self.cmd_str = cmd_str
     """ This isn't documented in the manual, but the command is getPumpState(0)"""
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -246,9 +258,8 @@ class JACOBPumpError(Entity):
         logger.debug("Pump status response: {}".format(result))
         return result.split(',')[2] # return the pump status (0=stopped, 1=running?)
 
-
 __all__.append('JACOBFlow')
-class JACOBFlow(Entity):
+class JACOBFlow(CachedGetMixin, Entity):
     def __init__(self,
                  cmd_str=None,
                  **kwargs):
@@ -256,7 +267,7 @@ class JACOBFlow(Entity):
         Args:
             cmd_str (str): query string to send to jacob
         '''
-        Entity.__init__(self, **kwargs)
+        CachedGetMixin.__init__(self, **kwargs)
         if cmd_str is None:
             raise ThrowReply('service_error_invalid_value', '<base_str> is required to __init__ SimpleSCPIEntity instance')
         else:
@@ -269,6 +280,7 @@ class JACOBFlow(Entity):
     0 = Status (See Status Summary
     """
 
+    @cached_get
     @calibrate()
     def on_get(self):
         result=self.service.send_to_device(self.cmd_str)
@@ -281,6 +293,48 @@ class JACOBFlow(Entity):
         return result[1] # return the flow in uMoles/s
 
 
+__all__.append('JACOBFields')
+class JACOBFields(CachedGetMixin, Entity):
+    def __init__(self,
+                 cmd_str=None,
+                 field_names=None,
+                 **kwargs):
+        '''
+        Args:
+            cmd_str (str): query string to send to jacob
+            field_names (list): one name per comma separated field of the reply, e.g.
+                [resistance, temperature, time, status] for readTemp; fields named None are dropped
+        '''
+        CachedGetMixin.__init__(self, **kwargs)
+        if cmd_str is None:
+            raise ThrowReply('service_error_invalid_value', '<cmd_str> is required to __init__ JACOBFields instance')
+        if not field_names:
+            raise ThrowReply('service_error_invalid_value', '<field_names> is required to __init__ JACOBFields instance')
+        self.cmd_str = cmd_str
+        self.field_names = field_names
+    """ Publishes every field of one response, e.g. status, warn and error of getPumpState(0), as
+    {name: value}, with numeric fields converted to float"""
+
+    @cached_get
+    @single_flight
+    @calibrate()
+    def on_get(self):
+        result=self.service.send_to_device(self.cmd_str)
+        result = result.split(',')
+        if len(result)!=len(self.field_names):
+            logger.warning("response to {} invalid: {}".format(self.cmd_str, result))
+            raise ThrowReply('resource_error',"Invalid response to {}".format(self.cmd_str))
+        fields = {}
+        for name, value in zip(self.field_names, result):
+            if name is None:
+                continue
+            try:
+                fields[name] = float(value)
+            except ValueError:
+                fields[name] = value
+        return fields
+
+
 __all__.append('JACOBService')
 class JACOBService(Service):
     '''
@@ -291,6 +345,15 @@ class JACOBService(Service):
                  socket_info=('localhost', 1234),
                  response_terminator=None,
                  reply_echo_cmd=False,
+                 command_gap=0.2,
+                 adaptive_pacing=False,
+                 max_command_gap=2.0,
+                 share_window=0,
+                 transport='socket',
+                 queue_size=32,
+                 request_timeout=3.0,
+                 command_priorities={},
+                 default_priority=10,
                  **kwargs
                  ):
         '''
@@ -304,6 +367,21 @@ class JACOBService(Service):
             reconnect_test (str): expected return from the last command in the cmd_at_reconnect list, must
                 match exactly or the reconnect is deemed a failure
             reply_echo_cmd (bool): indicates that the device includes the the received command in its reply
+            command_gap (float): minimum number of seconds between the device's last reply and the next
+                command; a command sent after a longer idle time goes out immediately
+            adaptive_pacing (bool): if True, the gap doubles (up to max_command_gap) every time an exchange
+                fails and decays back toward command_gap as exchanges succeed
+            max_command_gap (float): upper bound of the adaptive gap
+            share_window (float): a command identical to one answered less than share_window seconds
+                ago is served that reply instead of querying the device again, so e.g. the pump
+                status/warn/error endpoints share one getPumpState exchange; 0 (default) disables sharing
+            transport (str): 'socket' (default) for a blocking socket behind alock, or 'asyncio' for the
+                queued JACOBAsyncClient, where the options below apply
+            queue_size (int): maximum number of requests waiting for the device; further requests fail at once
+            request_timeout (float): seconds a request may wait in the queue plus for its reply
+            command_priorities (dict): priority by command name (the part before the parenthesis), e.g.
+                {readValve: 0}; lower priorities are sent first
+            default_priority (int): priority of commands not in command_priorities
 
         '''
         Service.__init__(self, **kwargs)
@@ -315,6 +393,16 @@ class JACOBService(Service):
             socket_info = (ip,int(port))
         
         self.alock = threading.Lock()
+        self.command_gap = float(command_gap)
+        self.adaptive_pacing = adaptive_pacing
+        self.max_command_gap = float(max_command_gap)
+        self._current_gap = self.command_gap
+        self._last_reply_time = None
+        self.share_window = float(share_window)
+        self._shared_replies = {}
+        self._shared_flight = SingleFlight()
+        # replies are read into this buffer, which only ever grows to the largest reply seen
+        self._recv_buffer = bytearray(4096)
         self.socket = socket.socket()
         self.socket_timeout = float(socket_timeout)
         self.socket_info = socket_info
@@ -328,7 +416,17 @@ class JACOBService(Service):
         #one JACOB device, so I think it is ok to hardcode them here 
         #self.add_child(JACOBEntity(name="JACOB_last_error",cmd_str="getLastError()"))
 
-        self._reconnect()
+        if transport not in ('socket', 'asyncio'):
+            raise ThrowReply('service_error_invalid_value', f'unknown JACOBService transport <{transport}>')
+        self.request_timeout = float(request_timeout)
+        self.command_priorities = command_priorities
+        self.default_priority = default_priority
+        self._client = None
+        if transport == 'asyncio':
+            # connects on the first request
+            self._client = JACOBAsyncClient(self, queue_size)
+        else:
+            self._reconnect()
 
     def _reconnect(self):
         '''
@@ -352,18 +450,30 @@ class JACOBService(Service):
 
         command needs to just be a single string
         '''
+        if self._client is not None:
+            return self._send_queued(command, kwargs.get('priority'), kwargs.get('timeout'))
         self.alock.acquire()
-
+        if self.share_window > 0:
+            shared = self._shared_replies.get(command)
+            if shared is not None and time.monotonic() - shared[0] <= self.share_window:
+                self.alock.release()
+                logger.debug(f"sharing the reply to {command} received {time.monotonic() - shared[0]:.3f} s ago")
+                return shared[1]
+
+        data = None
         try:
-            time.sleep(0.2)
+            self._pace()
             data = self._send_command(command)
+            self._adapt_gap(failed=False)
         except socket.error as err:
+            self._adapt_gap(failed=True)
             logger.warning(f"socket.error <{err}> received, attempting reconnect")
             self._reconnect()
             data = self._send_command(command)
             logger.critical("Ethernet connection reestablished")
         # exceptions.DriplineHardwareResponselessError
         except Exception as err:
+            self._adapt_gap(failed=True)
             logger.critical(str(err))
             try:
                 self._reconnect()
@@ -376,30 +486,211 @@ class JACOBService(Service):
                 logger.critical("Query failed after successful ethernet socket reconnect")
                 raise ThrowReply('resource_error_no_response', str(err))
         finally:
+            self._last_reply_time = time.monotonic()
+            if self.share_window > 0 and data is not None:
+                # stored before releasing alock, so a thread waiting for it with the same command is served this reply
+                self._shared_replies[command] = (self._last_reply_time, data)
             self.alock.release()
         to_return =data
         logger.debug(f"should return:\n{to_return}")
         return to_return
 
 
+    def _send_queued(self, command, priority=None, timeout=None):
+        '''
+        send_to_device through the JACOBAsyncClient queue
+
+        priority (int): overrides the command's configured priority
+        timeout (float): overrides request_timeout
+        '''
+        if priority is None:
+            priority = self.command_priorities.get(command.split('(')[0].strip(), self.default_priority)
+        if timeout is None:
+            timeout = self.request_timeout
+        if self.share_window > 0:
+            shared = self._shared_replies.get(command)
+            if shared is not None and time.monotonic() - shared[0] <= self.share_window:
+                return shared[1]
+            # identical commands arriving while one is queued or in flight share its reply
+            data = self._shared_flight.do(command, self._request_shared, command, priority, timeout)
+        else:
+            data = self._client.request(command, priority, timeout)
+        logger.debug(f"should return:\n{data}")
+        return data
+
+    def _request_shared(self, command, priority, timeout):
+        data = self._client.request(command, priority, timeout)
+        self._shared_replies[command] = (time.monotonic(), data)
+        return data
+
+    def _pace_delay(self):
+        '''
+        Seconds remaining of the current gap since the last reply
+        '''
+        if self._last_reply_time is None:
+            return 0
+        return self._current_gap - (time.monotonic() - self._last_reply_time)
+
+    def _pace(self):
+        '''
+        Waits out whatever remains of the current gap since the last reply.  Called holding alock.
+        '''
+        wait = self._pace_delay()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _adapt_gap(self, failed):
+        if not self.adaptive_pacing:
+            return
+        if failed:
+            self._current_gap = min(self.max_command_gap, max(2 * self._current_gap, 0.05))
+            logger.info(f"JACOB exchange failed, command gap raised to {self._current_gap:.3f} s")
+        else:
+            self._current_gap = max(self.command_gap, 0.9 * self._current_gap)
+
+    def _recv_exactly(self, n_bytes):
+        '''
+        Receives exactly n_bytes, however many TCP segments they arrive in, into the reusable receive
+        buffer and returns a memoryview of them (valid until the next receive).
+        '''
+        if len(self._recv_buffer) < n_bytes:
+            self._recv_buffer = bytearray(max(n_bytes, 2 * len(self._recv_buffer)))
+        view = memoryview(self._recv_buffer)
+        received = 0
+        while received < n_bytes:
+            count = self.socket.recv_into(view[received:n_bytes], n_bytes - received)
+            if count == 0:
+                raise socket.error(f"connection closed after {received} of {n_bytes} bytes")
+            received += count
+        return view[:n_bytes]
+
     def _send_command(self, command):
         '''
         Take a single command, send to instrument and receive responses, do any necessary formatting.
 
         commands (str): command to send to instrument, should be a single string, not a list of strings
         '''
-        length_bytes=len(command).to_bytes(4, byteorder = 'big')
-        bytes_to_send=(length_bytes.decode() + command).encode()
-        logger.debug(f"sending: {command.encode()}")
-        self.socket.send(bytes_to_send)
+        # messages both ways are a 4 byte big endian length followed by that many bytes
+        encoded = command.encode()
+        logger.debug(f"sending: {encoded}")
+        self.socket.sendall(len(encoded).to_bytes(4, byteorder = 'big') + encoded)
         try:
-            #read the length of the response
-            lenstr=self.socket.recv(4)
-            length=int.from_bytes(lenstr, byteorder = 'big')
-            #then read that many bytes
-            data=self.socket.recv(length).decode(errors='replace')
+            length = int.from_bytes(self._recv_exactly(4), byteorder = 'big')
+            data = str(self._recv_exactly(length), 'utf-8', errors='replace')
         except socket.timeout:
-            logger.warning(f"socket.timeout condition met; received:\n{repr(data)}")
+            logger.warning(f"socket.timeout condition met while reading the reply to {command}")
             raise ThrowReply('resource_error_no_response', "Timeout while waiting for a response from the instrument")
         logger.debug(repr(data))
         return data
+
+
+__all__.append('JACOBAsyncClient')
+class JACOBAsyncClient(object):
+    '''
+    asyncio transport for JACOBService.  Requests go into a bounded priority queue and are served one
+    at a time over a single connection by a worker on an event loop running in a daemon thread.  A
+    request whose deadline passes while queued is dropped without being sent, and one whose reply is
+    late fails on its own without holding up the requests behind it any longer than its deadline.
+    '''
+    def __init__(self, service, queue_size=32):
+        '''
+        Args:
+            service (JACOBService): supplies socket_info and the pacing state
+            queue_size (int): maximum number of requests waiting for the device
+        '''
+        self.service = service
+        self.queue_size = queue_size
+        self._reader = None
+        self._writer = None
+        self._sequence = itertools.count()
+        self._loop = asyncio.new_event_loop()
+        self._queue = None
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name='JACOBAsyncClient', daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.PriorityQueue(maxsize=self.queue_size)
+        self._loop.create_task(self._worker())
+        self._loop.call_soon(ready.set)
+        self._loop.run_forever()
+
+    def request(self, command, priority, timeout):
+        '''
+        Queues command and blocks until its reply, raising ThrowReply if the queue is full or
+        the reply has not arrived within timeout seconds.
+        '''
+        deadline = time.monotonic() + timeout
+        pending = asyncio.run_coroutine_threadsafe(self._submit(command, priority, deadline), self._loop)
+        return pending.result()
+
+    async def _submit(self, command, priority, deadline):
+        reply = self._loop.create_future()
+        try:
+            self._queue.put_nowait((priority, next(self._sequence), deadline, command, reply))
+        except asyncio.QueueFull:
+            raise ThrowReply('resource_error', f"JACOB request queue full ({self.queue_size} pending), dropping {command}")
+        try:
+            return await asyncio.wait_for(reply, max(0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise ThrowReply('resource_error_no_response', f"No reply to {command} before its deadline")
+
+    async def _worker(self):
+        while True:
+            priority, _, deadline, command, reply = await self._queue.get()
+            wait = self.service._pace_delay()
+            if wait > 0 and not reply.done():
+                await asyncio.sleep(wait)
+            if reply.done():
+                # its caller has already given up
+                continue
+            if deadline <= time.monotonic():
+                # expired while queued or paced, never sent
+                reply.set_exception(ThrowReply('resource_error_no_response', f"{command} expired before it could be sent"))
+                continue
+            try:
+                data = await self._exchange(command, deadline)
+            except Exception as err:
+                if not reply.done():
+                    reply.set_exception(err)
+            else:
+                if not reply.done():
+                    reply.set_result(data)
+
+    async def _exchange(self, command, deadline):
+        service = self.service
+        try:
+            data = await asyncio.wait_for(self._send_command(command), deadline - time.monotonic())
+            service._adapt_gap(failed=False)
+            return data
+        except (OSError, EOFError, asyncio.TimeoutError) as err:
+            service._adapt_gap(failed=True)
+            # a late reply must not be taken as the answer to the next request
+            self._close()
+            if isinstance(err, asyncio.TimeoutError):
+                raise ThrowReply('resource_error_no_response', f"No reply to {command} before its deadline")
+            logger.warning(f"JACOB connection error <{err}>, reconnecting on the next request")
+            raise ThrowReply('resource_error_connection', f"JACOB connection error: {err}")
+        finally:
+            service._last_reply_time = time.monotonic()
+
+    async def _send_command(self, command):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(*self.service.socket_info)
+            logger.info(f"Ethernet socket {self.service.socket_info} established")
+        encoded = command.encode()
+        logger.debug(f"sending: {encoded}")
+        self._writer.write(len(encoded).to_bytes(4, byteorder = 'big') + encoded)
+        await self._writer.drain()
+        length = int.from_bytes(await self._reader.readexactly(4), byteorder = 'big')
+        data = (await self._reader.readexactly(length)).decode(errors='replace')
+        logger.debug(repr(data))
+        return data
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
@@ -1,3 +0,0 @@
-x=[1789.98,1792.99,1796.0,1799.01,1802.02,1805.04,1808.06,1811.08,1814.1,1817.14,1820.17,1823.22,1826.27,1829.33,1832.4,1835.47,1838.56,1841.66,1844.76,1847.88,1851.02,1854.16,1857.32,1860.49,1863.68,1866.88,1870.1,1873.34,1876.59,1879.87,1883.16,1886.47,1889.8,1893.15,1896.52,1899.92,1903.34,1906.78,1910.24,1913.73,1917.25,1920.79,1924.36,1927.96,1931.58,1935.23,1938.91,1942.62,1946.37,1950.14,1953.94,1957.78,1961.65,1965.56,1969.5,1973.47,1977.48,1981.53,1985.61,1989.73,1993.89,1998.1,2002.34,2006.63,2010.97,2015.35,2019.78,2024.25,2028.78,2033.36,2037.99,2042.68,2047.42,2052.22,2057.07,2061.99,2066.97,2072.0,2077.1,2082.27,2087.5,2092.8,2098.16,2103.6,2109.1,2114.68,2120.33,2126.06,2131.86,2137.74,2143.7,2149.74,2155.86,2162.06,2168.35,2174.72,2181.17,2187.71,2194.34,2201.06,2207.87,2214.77,2221.76,2228.84,2236.02,2243.29,2250.65,2258.12,2265.68,2273.34,2281.09,2288.95,2296.91,2304.97,2313.14,2321.41,2329.79,2338.27,2346.86,2355.56,2364.36,2373.28,2382.31,2391.46,2400.72,2410.12,2419.66,2429.35,2439.21,2449.24,2459.45,2469.85,2480.45,2491.26,2502.29,2513.55,2525.06,2536.81,2548.82,2561.11,2573.67,2586.52,2599.68,2613.14,2626.92,2641.02,2655.45,2670.18,2685.17,2700.38,2715.81,2731.4,2747.13,2762.98,2778.9,2794.88,2810.87,2826.85,2842.79,2858.65,2874.41,2890.04,2905.54,2920.89,2936.08,2951.1,2965.94,2980.59,2995.04,3009.28,3023.3,3037.08,3050.61,3063.84,3076.72,3089.19,3101.18,3112.65,3123.54,3133.79,3143.34,3152.15,3160.23,3167.63,3174.43,3180.69,3186.47,3191.84,3196.86,3201.59,3206.1,3210.45,3214.71,3218.93,3223.14,3227.34,3231.53,3235.71,3239.89,3244.06]
-
-y=[0.649,0.645874,0.642748,0.639622,0.636495,0.633369,0.630243,0.627117,0.623991,0.620865,0.617739,0.614613,0.611486,0.60836,0.605234,0.602108,0.598982,0.595856,0.59273,0.589604,0.586477,0.583351,0.580225,0.577099,0.573973,0.570847,0.567721,0.564594,0.561468,0.558342,0.555216,0.55209,0.548964,0.545838,0.542712,0.539585,0.536459,0.533333,0.530207,0.527081,0.523955,0.520829,0.517703,0.514576,0.51145,0.508324,0.505198,0.502072,0.498946,0.49582,0.492693,0.489567,0.486441,0.483315,0.480189,0.477063,0.473937,0.470811,0.467684,0.464558,0.461432,0.458306,0.45518,0.452054,0.448928,0.445802,0.442675,0.439549,0.436423,0.433297,0.430171,0.427045,0.423919,0.420792,0.417666,0.41454,0.411414,0.408288,0.405162,0.402036,0.39891,0.395783,0.392657,0.389531,0.386405,0.383279,0.380153,0.377027,0.373901,0.370774,0.367648,0.364522,0.361396,0.35827,0.355144,0.352018,0.348891,0.345765,0.342639,0.339513,0.336387,0.333261,0.330135,0.327009,0.323882,0.320756,0.31763,0.314504,0.311378,0.308252,0.305126,0.301999,0.298873,0.295747,0.292621,0.289495,0.286369,0.283243,0.280117,0.27699,0.273864,0.270738,0.267612,0.264486,0.26136,0.258234,0.255108,0.251981,0.248855,0.245729,0.242603,0.239477,0.236351,0.233225,0.230098,0.226972,0.223846,0.22072,0.217594,0.214468,0.211342,0.208216,0.205089,0.201963,0.198837,0.195711,0.192585,0.189459,0.186333,0.183207,0.18008,0.176954,0.173828,0.170702,0.167576,0.16445,0.161324,0.158197,0.155071,0.151945,0.148819,0.145693,0.142567,0.139441,0.136315,0.133188,0.130062,0.126936,0.12381,0.120684,0.117558,0.114432,0.111306,0.108179,0.105053,0.101927,0.098801,0.095675,0.092549,0.089423,0.086296,0.08317,0.080044,0.076918,0.073792,0.070666,0.06754,0.064414,0.061287,0.058161,0.055035,0.051909,0.048783,0.045657,0.042531,0.039405,0.036278,0.033152,0.030026,0.0269]
@@ -1,3 +0,0 @@
-x=[1001.457,1049.084821,1050.134248,1051.234436,1052.390136,1053.606421,1054.888644,1056.243185,1057.676999,1059.198157,1060.815407,1062.539058,1064.38032,1066.352388,1068.469693,1070.749315,1073.209983,1075.873923,1078.765815,1081.915923,1085.357865,1089.133117,1091.160926,1093.291746,1095.533606,1097.895843,1100.388624,1103.023917,1105.814816,1108.77684,1111.927001,1115.285453,1118.874253,1122.719262,1126.848597,1131.294538,1136.091908,1141.279985,1146.901466,1153.006101,1159.651242,1166.914569,1174.892047,1183.729192,1193.602217,1204.749899,1217.387866,1231.550801,1247.555875,1266.577909,1275.009829,1283.981548,1293.598717,1303.938409,1315.072734,1327.083484,1340.082629,1354.198663,1369.584452,1386.413226,1395.434894,1404.902528,1414.850356,1425.317761,1436.34781,1447.990209,1460.299587,1473.339586,1487.180513,1501.904756,1517.603674,1534.384654,1552.367053,1571.690996,1592.512433,1615.01362,1639.39797,1665.903196,1694.797923,1726.404524,1761.101101,1799.379277,1841.854094,1889.421115,1943.25369,2005.176674,2077.479961,2162.932548,2211.300018,2263.645311,2320.08459,2380.766505,2446.939292,2523.006605,2609.096455,2704.598442,2812.424605,2936.56535,3080.725123,3250.526173,3453.501016,3700.518459,3815.025036,3940.325984,4078.034019,4230.017884,4398.490695,4586.345291,4797.016459,5034.682083,5304.975959,5615.030288,5787.871933,5974.483538,6176.700265,6396.627086,6636.72171,6900.156905,7190.651688,7512.681341,7872.352068,8277.055764,8735.858457,9261.107013,9868.5957,10579.59141,11421.60916,12431.61257,13658.21729,15165.46324,17039.12911,19400.46809,20820.34136,22443.68027,24330.67681,26563.61824,29253.30998,32601.28279,37123.89615,43515.77963,52106.70612,63765.09333]
-
-y=[290.0,40.0,39.0,38.0,37.0,36.0,35.0,34.0,33.0,32.0,31.0,30.0,29.0,28.0,27.0,26.0,25.0,24.0,23.0,22.0,21.0,20.0,19.5,19.0,18.5,18.0,17.5,17.0,16.5,16.0,15.5,15.0,14.5,14.0,13.5,13.0,12.5,12.0,11.5,11.0,10.5,10.0,9.5,9.0,8.5,8.0,7.5,7.0,6.5,6.0,5.8,5.6,5.4,5.2,5.0,4.8,4.6,4.4,4.2,4.0,3.9,3.8,3.7,3.6,3.5,3.4,3.3,3.2,3.1,3.0,2.9,2.8,2.7,2.6,2.5,2.4,2.3,2.2,2.1,2.0,1.9,1.8,1.7,1.6,1.5,1.4,1.3,1.2,1.15,1.1,1.05,1.0,0.95,0.9,0.85,0.8,0.75,0.7,0.65,0.6,0.55,0.5,0.48,0.46,0.44,0.42,0.4,0.38,0.36,0.34,0.32,0.3,0.29,0.28,0.27,0.26,0.25,0.24,0.23,0.22,0.21,0.2,0.19,0.18,0.17,0.16,0.15,0.14,0.13,0.12,0.11,0.1,0.095,0.09,0.085,0.08,0.075,0.07,0.065,0.06,0.055,0.05]
@@ -1,3 +0,0 @@
-x=[2243.15079,2247.82837,2252.67166,2257.69243,2262.90261,2268.31491,2273.94482,2279.80871,2285.92402,2292.31202,2298.99522,2305.9975,2313.34748,2321.07639,2329.22022,2337.81827,2346.91684,2356.56678,2366.82826,2377.76798,2389.46691,2395.62834,2402.01464,2408.63985,2415.51928,2422.66923,2430.10802,2437.85528,2445.93319,2454.36563,2463.1799,2472.40561,2482.0771,2492.23191,2502.91428,2514.17316,2526.06737,2538.66273,2552.04016,2566.29151,2581.53294,2597.89797,2615.55884,2634.71721,2655.64429,2678.65722,2704.1657,2732.66353,2764.8467,2778.92267,2793.7502,2801.45795,2809.36833,2825.86689,2843.52852,2862.62685,2883.18617,2905.22478,2928.99838,2954.81636,2968.57579,2982.95671,2998.00688,3013.7785,3030.3276,3047.71832,3066.02023,3085.31287,3105.68292,3127.23059,3150.06591,3174.31753,3200.12792,3227.66617,3257.12144,3288.72235,3322.72791,3359.4576,3399.27876,3442.65523,3490.12849,3542.39691,3600.28855,3664.89413,3737.51755,3819.8713,3914.02777,4022.7531,4083.59511,4149.45062,4220.96354,4298.96074,4384.44215,4478.77921,4583.74002,4701.99101,4836.59754,4990.61179,5166.85835,5369.38032,5611.83504,5903.84562,6038.02877,6184.22615,6344.06831,6519.43869,6712.7577,6926.90775,7165.50303,7432.94622,7735.11284,7981.040351,8174.49375,8370.366667,8608.036364,8834.364286,9082.326316,9385.4375,9688.482353,10043.05,10426.21176,10809.75882,11294.02857,11830.53571,12477.62083,13133.85294,13971.03846,14900.63846,16018.2,17335.77619,18827.46667,21068.28,23959.03125,27519.54839,32771.27941,40570.72727,53073.46154]
-
-y=[40.0,39.0,38.0,37.0,36.0,35.0,34.0,33.0,32.0,31.0,30.0,29.0,28.0,27.0,26.0,25.0,24.0,23.0,22.0,21.0,20.0,19.5,19.0,18.5,18.0,17.5,17.0,16.5,16.0,15.5,15.0,14.5,14.0,13.5,13.0,12.5,12.0,11.5,11.0,10.5,10.0,9.5,9.0,8.5,8.0,7.5,7.0,6.5,6.0,5.8,5.6,5.5,5.4,5.2,5.0,4.8,4.6,4.4,4.2,4.0,3.9,3.8,3.7,3.6,3.5,3.4,3.3,3.2,3.1,3.0,2.9,2.8,2.7,2.6,2.5,2.4,2.3,2.2,2.1,2.0,1.9,1.8,1.7,1.6,1.5,1.4,1.3,1.2,1.15,1.1,1.05,1.0,0.95,0.9,0.85,0.8,0.75,0.7,0.65,0.6,0.55,0.5,0.48,0.46,0.44,0.42,0.4,0.38,0.36,0.34,0.32,0.303470789,0.293266313,0.283426574,0.273631121,0.264780786,0.253990474,0.244396833,0.234675961,0.224055778,0.214554471,0.205025392,0.195204976,0.185011714,0.175121431,0.165502314,0.155727744,0.146109154,0.136536905,0.12710754,0.117839644,0.107089533,0.096642596,0.086249913,0.075646374,0.066028855,0.056301649]
@@ -1,3 +0,0 @@
-x=[28.27139,28.49986,28.73455,28.97568,29.2235,29.47826,29.74024,30.0097,30.28696,30.57232,30.86611,30.97702,31.16868,31.48039,31.80163,32.13282,32.47437,32.82677,33.19048,33.56605,33.954,34.35494,34.7695,35.19833,35.64216,36.10176,36.57795,37.0716,37.58367,38.11519,38.66725,39.24105,39.83789,40.45919,41.10649,41.78149,42.48607,43.22228,43.99246,44.79918,45.64538,46.53437,47.46999,48.45659,49.49935,50.60416,51.77824,53.02976,54.36864,55.80618,57.35393,58.22636,59.03306,60.86241,62.86809,65.08295,66.03648,67.03325,68.07672,69.17082,70.31994,71.52884,72.80302,74.14861,75.57259,77.08291,77.87327,78.68877,79.53082,80.4009,81.30067,82.23196,83.19675,84.1972,85.23577,86.31515,87.43839,88.60892,89.83059,91.10785,92.44573,93.85008,95.32767,96.88638,98.53557,100.2862,101.2035,102.1514,103.1317,104.1469,105.1994,106.2919,107.4276,108.61,109.8429,111.1299,112.4761,113.8882,115.373,116.9373,118.5891,120.3382,122.1959,124.1751,126.2914,128.5629,131.0115,133.6638,136.5518,139.7156,143.2044,147.0827,151.4306,156.3559,158.5185,160.8075,163.2354,165.8174,168.5708,171.5153,174.6741,178.0747,181.7503,185.7388,187.8648,190.0875,192.4143,194.8536,197.4146,200.1077,202.9445,205.938,209.1028,212.456,216.016,219.8049,223.8473,228.1719,232.8117,237.8057,243.1984,249.0438,255.4044,262.3575,269.9944,278.4311,287.8094,298.3214,310.2079,323.7988,339.5093,357.9109,368.3563,379.7919,392.37,406.2695,421.7146,438.9734,458.3866,480.3778,505.4976,534.4627,568.2375,608.1638,656.1656,715.1293,742.723,773.152,806.9219,844.6524,887.0811,935.1975,990.2405,1053.779,1127.874,1215.168,1264.808,1319.124,1378.733,1444.344,1516.796,1597.152,1686.669,1786.914,1900.064,2028.83,2177.154,2350.59,2556.797,2806.679,3115.529,3503.078,3975.725,4538.936,5253.513,6238.339]
-
-y=[325.0,320.0,315.0,310.0,305.0,300.0,295.0,290.0,285.0,280.0,275.0,273.15,270.0,265.0,260.0,255.0,250.0,245.0,240.0,235.0,230.0,225.0,220.0,215.0,210.0,205.0,200.0,195.0,190.0,185.0,180.0,175.0,170.0,165.0,160.0,155.0,150.0,145.0,140.0,135.0,130.0,125.0,120.0,115.0,110.0,105.0,100.0,95.0,90.0,85.0,80.0,77.35,75.0,70.0,65.0,60.0,58.0,56.0,54.0,52.0,50.0,48.0,46.0,44.0,42.0,40.0,39.0,38.0,37.0,36.0,35.0,34.0,33.0,32.0,31.0,30.0,29.0,28.0,27.0,26.0,25.0,24.0,23.0,22.0,21.0,20.0,19.5,19.0,18.5,18.0,17.5,17.0,16.5,16.0,15.5,15.0,14.5,14.0,13.5,13.0,12.5,12.0,11.5,11.0,10.5,10.0,9.5,9.0,8.5,8.0,7.5,7.0,6.5,6.0,5.8,5.6,5.4,5.2,5.0,4.8,4.6,4.4,4.2,4.0,3.9,3.8,3.7,3.6,3.5,3.4,3.3,3.2,3.1,3.0,2.9,2.8,2.7,2.6,2.5,2.4,2.3,2.2,2.1,2.0,1.9,1.8,1.7,1.6,1.5,1.4,1.3,1.2,1.15,1.1,1.05,1.0,0.95,0.9,0.85,0.8,0.75,0.7,0.65,0.6,0.55,0.5,0.48,0.46,0.44,0.42,0.4,0.38,0.36,0.34,0.32,0.3,0.29,0.28,0.27,0.26,0.25,0.24,0.23,0.22,0.21,0.2,0.19,0.18,0.17,0.16,0.15,0.14,0.13,0.12,0.11,0.1]
@@ -1,3 +0,0 @@
-x=[27.15772,27.37799,27.60233,27.83144,28.06597,28.30651,28.5536,28.80776,29.06947,29.33916,29.61726,29.72237,29.90417,30.20028,30.50594,30.82152,31.14741,31.48397,31.83161,32.19076,32.56191,32.94557,33.34232,33.75279,34.1777,34.6178,35.07394,35.54703,36.03802,36.54796,37.07795,37.62916,38.20282,38.80029,39.42299,40.07249,40.75058,41.45921,42.20069,42.97759,43.79299,44.65032,45.55359,46.50724,47.51626,48.58618,49.72339,50.9352,52.23115,53.6239,55.12893,55.97658,56.76041,58.54077,60.49597,62.65852,63.59045,64.56515,65.58601,66.65691,67.78219,68.96657,70.21553,71.53522,72.93265,74.41587,75.19253,75.99422,76.82241,77.67861,78.56448,79.48189,80.43285,81.41953,82.44442,83.51021,84.61998,85.77711,86.98546,88.24941,89.57395,90.96483,92.42873,93.97342,95.60815,97.34381,98.2535,99.19359,100.1661,101.1735,102.2182,103.3032,104.4316,105.607,106.8335,108.1157,109.4586,110.8675,112.3487,113.9096,115.559,117.3064,119.163,121.142,123.2588,125.5322,127.9839,130.6412,133.5363,136.7104,140.2133,144.1116,148.4867,153.4497,155.6309,157.9412,160.3934,163.0028,165.7873,168.7669,171.9658,175.4116,179.138,183.1841,185.3416,187.5979,189.9604,192.4378,195.0394,197.7759,200.6593,203.703,206.9222,210.3344,213.9592,217.8198,221.9423,226.3574,231.1003,236.2134,241.7451,247.7525,254.3025,261.4784,269.3746,278.0907,287.7559,298.5891,310.8637,324.9117,341.1458,360.1512,370.9367,382.7451,395.737,410.1024,426.0828,443.9691,464.136,487.054,513.3417,543.8095,579.5537,622.0959,673.6043,737.2897,767.2017,800.2414,836.9459,877.9696,924.0944,976.3622,1036.072,1104.899,1185.083,1279.583,1333.42,1392.467,1457.502,1529.442,1609.374,1698.692,1799.072,1912.566,2041.91,2190.509,2362.904,2565.144,2805.524,3095.678,3451.538,3895.466,4459.86,5188.519,6132.782,7415.246]
-
-y=[325.0,320.0,315.0,310.0,305.0,300.0,295.0,290.0,285.0,280.0,275.0,273.15,270.0,265.0,260.0,255.0,250.0,245.0,240.0,235.0,230.0,225.0,220.0,215.0,210.0,205.0,200.0,195.0,190.0,185.0,180.0,175.0,170.0,165.0,160.0,155.0,150.0,145.0,140.0,135.0,130.0,125.0,120.0,115.0,110.0,105.0,100.0,95.0,90.0,85.0,80.0,77.35,75.0,70.0,65.0,60.0,58.0,56.0,54.0,52.0,50.0,48.0,46.0,44.0,42.0,40.0,39.0,38.0,37.0,36.0,35.0,34.0,33.0,32.0,31.0,30.0,29.0,28.0,27.0,26.0,25.0,24.0,23.0,22.0,21.0,20.0,19.5,19.0,18.5,18.0,17.5,17.0,16.5,16.0,15.5,15.0,14.5,14.0,13.5,13.0,12.5,12.0,11.5,11.0,10.5,10.0,9.5,9.0,8.5,8.0,7.5,7.0,6.5,6.0,5.8,5.6,5.4,5.2,5.0,4.8,4.6,4.4,4.2,4.0,3.9,3.8,3.7,3.6,3.5,3.4,3.3,3.2,3.1,3.0,2.9,2.8,2.7,2.6,2.5,2.4,2.3,2.2,2.1,2.0,1.9,1.8,1.7,1.6,1.5,1.4,1.3,1.2,1.15,1.1,1.05,1.0,0.95,0.9,0.85,0.8,0.75,0.7,0.65,0.6,0.55,0.5,0.48,0.46,0.44,0.42,0.4,0.38,0.36,0.34,0.32,0.3,0.29,0.28,0.27,0.26,0.25,0.24,0.23,0.22,0.21,0.2,0.19,0.18,0.17,0.16,0.15,0.14,0.13,0.12,0.11,0.1]
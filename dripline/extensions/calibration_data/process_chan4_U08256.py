@@ -1,3 +0,0 @@
-x=[2196.843245,2207.751388,2219.850927,2233.42254,2248.684427,2260.609547,2271.931869,2282.482492,2294.164681,2306.8362,2320.743416,2336.225287,2347.649558,2358.679851,2370.609999,2383.574865,2397.061787,2412.273565,2428.848032,2447.54623,2468.546101,2492.288108,2519.87206,2552.187964,2590.290798,2636.540459,2685.261426,2733.039475,2774.356701,2813.637221,2855.694975,2882.046191,2908.728958,2937.733398,2968.804584,3004.295101,3045.052596,3089.789511,3140.218842,3196.957316,3265.923904,3344.432205,3439.020714,3557.680349,3702.324874,3790.900364,3885.05,3940.09,4072.01,4227.51,4407.87,4618.73,4851.55,5122.7,5468.3,5816.6,6258.4,6757.9,7242.6,7550.7,7902.3,8536.2,9348.9,10293.9,11341.7,12580.8,13888.4,15770.6,18105.5,21634.3,25373.6,30005.2,36747.1,43190.6,49193.3,56725.0,65152.0]
-
-y=[44.920647,41.916298,38.926218,35.926757,32.935481,30.839215,29.045591,27.451132,25.87175,24.303928,22.721717,21.137521,20.063608,19.094224,18.131468,17.169519,16.205522,15.239749,14.269353,13.285497,12.287857,11.279395,10.252113,9.214333,8.174037,7.131764,6.239694,5.528966,5.015482,4.59706,4.208679,3.993563,3.794094,3.595748,3.402767,3.203347,2.998211,2.798152,2.59936,2.403018,2.198203,2.000652,1.801763,1.598384,1.401006,1.301139,1.203138,1.15236,1.050043,0.950141,0.855061,0.76511,0.685179,0.610459,0.535591,0.476752,0.418563,0.368078,0.329926,0.309779,0.289774,0.260013,0.230342,0.204119,0.181797,0.161546,0.145235,0.127555,0.111785,0.095214,0.083279,0.072954,0.063033,0.056773,0.052502,0.048264,0.044582]
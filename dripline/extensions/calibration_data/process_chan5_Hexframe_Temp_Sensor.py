@@ -1,3 +0,0 @@
-x=[1764.99,1767.34,1769.69,1772.04,1774.39,1776.75,1779.11,1781.48,1783.86,1786.24,1788.63,1791.04,1793.45,1795.88,1798.32,1800.77,1803.24,1805.72,1808.22,1810.74,1813.27,1815.83,1818.41,1821.01,1823.63,1826.28,1828.95,1831.64,1834.37,1837.12,1839.9,1842.71,1845.55,1848.43,1851.33,1854.27,1857.25,1860.26,1863.3,1866.39,1869.51,1872.67,1875.88,1879.12,1882.41,1885.75,1889.12,1892.55,1896.01,1899.53,1903.1,1906.71,1910.38,1914.1,1917.87,1921.69,1925.57,1929.51,1933.5,1937.55,1941.65,1945.82,1950.04,1954.32,1958.67,1963.07,1967.53,1972.06,1976.64,1981.29,1986.0,1990.78,1995.62,2000.53,2005.5,2010.53,2015.63,2020.8,2026.04,2031.35,2036.72,2042.16,2047.68,2053.26,2058.91,2064.64,2070.43,2076.3,2082.25,2088.26,2094.35,2100.52,2106.76,2113.07,2119.47,2125.94,2132.49,2139.13,2145.85,2152.66,2159.56,2166.55,2173.64,2180.82,2188.1,2195.48,2202.97,2210.56,2218.26,2226.07,2233.99,2242.02,2250.17,2258.44,2266.82,2275.34,2283.97,2292.73,2301.63,2310.65,2319.81,2329.1,2338.53,2348.1,2357.82,2367.69,2377.72,2387.92,2398.29,2408.83,2419.56,2430.48,2441.6,2452.92,2464.44,2476.19,2488.15,2500.34,2512.77,2525.44,2538.35,2551.51,2564.94,2578.62,2592.58,2606.82,2621.35,2636.19,2651.37,2666.91,2682.83,2699.17,2715.93,2733.15,2750.85,2769.04,2787.77,2807.05,2826.9,2847.34,2868.41,2890.1,2912.41,2935.32,2958.81,2982.88,3007.49,3032.65,3058.33,3084.52,3111.21,3138.37,3165.99,3193.99,3222.29,3250.82,3279.48,3308.19,3336.88,3365.46,3393.85,3421.97,3449.69,3476.86,3503.35,3528.99,3553.65,3577.16,3599.39,3620.18,3639.39,3656.86,3672.45,3686.05,3697.83,3708.08,3717.11,3725.23,3732.75,3739.96]
-
-y=[0.649,0.645874,0.642748,0.639622,0.636495,0.633369,0.630243,0.627117,0.623991,0.620865,0.617739,0.614613,0.611486,0.60836,0.605234,0.602108,0.598982,0.595856,0.59273,0.589604,0.586477,0.583351,0.580225,0.577099,0.573973,0.570847,0.567721,0.564594,0.561468,0.558342,0.555216,0.55209,0.548964,0.545838,0.542712,0.539585,0.536459,0.533333,0.530207,0.527081,0.523955,0.520829,0.517703,0.514576,0.51145,0.508324,0.505198,0.502072,0.498946,0.49582,0.492693,0.489567,0.486441,0.483315,0.480189,0.477063,0.473937,0.470811,0.467684,0.464558,0.461432,0.458306,0.45518,0.452054,0.448928,0.445802,0.442675,0.439549,0.436423,0.433297,0.430171,0.427045,0.423919,0.420792,0.417666,0.41454,0.411414,0.408288,0.405162,0.402036,0.39891,0.395783,0.392657,0.389531,0.386405,0.383279,0.380153,0.377027,0.373901,0.370774,0.367648,0.364522,0.361396,0.35827,0.355144,0.352018,0.348891,0.345765,0.342639,0.339513,0.336387,0.333261,0.330135,0.327009,0.323882,0.320756,0.31763,0.314504,0.311378,0.308252,0.305126,0.301999,0.298873,0.295747,0.292621,0.289495,0.286369,0.283243,0.280117,0.27699,0.273864,0.270738,0.267612,0.264486,0.26136,0.258234,0.255108,0.251981,0.248855,0.245729,0.242603,0.239477,0.236351,0.233225,0.230098,0.226972,0.223846,0.22072,0.217594,0.214468,0.211342,0.208216,0.205089,0.201963,0.198837,0.195711,0.192585,0.189459,0.186333,0.183207,0.18008,0.176954,0.173828,0.170702,0.167576,0.16445,0.161324,0.158197,0.155071,0.151945,0.148819,0.145693,0.142567,0.139441,0.136315,0.133188,0.130062,0.126936,0.12381,0.120684,0.117558,0.114432,0.111306,0.108179,0.105053,0.101927,0.098801,0.095675,0.092549,0.089423,0.086296,0.08317,0.080044,0.076918,0.073792,0.070666,0.06754,0.064414,0.061287,0.058161,0.055035,0.051909,0.048783,0.045657,0.042531,0.039405,0.036278,0.033152,0.030026,0.0269]
@@ -1,3 +0,0 @@
-x=[2206.873712,2217.884874,2230.460325,2244.40384,2260.211593,2272.765687,2284.434652,2295.973647,2308.320524,2322.029938,2336.976517,2352.542184,2364.504858,2375.765379,2387.889151,2401.282971,2415.454483,2430.828164,2447.768262,2466.898888,2488.08825,2512.218582,2540.402629,2572.804286,2611.184699,2657.763614,2702.676476,2750.392898,2790.756276,2828.669256,2878.722301,2903.673391,2930.414047,2959.363549,2991.099605,3026.672742,3066.971703,3111.621428,3161.125161,3221.082524,3288.668517,3366.751791,3461.09509,3578.192137,3726.030802,3812.325251,3919.18,3968.269302,4106.26,4261.84,4441.82,4649.27,4899.39,5154.62,5511.95,5857.84,6311.99,6818.4,7308.7,7610.5,7968.5,8634.2,9434.4,10440.2,11475.8,12740.5,14028.9,15976.9,18412.1,21866.2,25866.3,29758.1,35866.1,41201.2,45122.5,52131.6,59379.4]
-
-y=[45.30352,42.305867,39.310424,36.300677,33.289715,31.169813,29.351008,27.711149,26.059015,24.384568,22.749053,21.171531,20.102543,19.133117,18.167863,17.202605,16.238642,15.270053,14.302505,13.308357,12.310213,11.297587,10.266111,9.227716,8.185944,7.143482,6.315691,5.594798,5.083291,4.668812,4.202709,3.999411,3.800521,3.600987,3.403185,3.20274,3.000641,2.800371,2.604603,2.397905,2.197971,2.000477,1.801306,1.60037,1.399492,1.302145,1.19799,1.154999,1.049379,0.950365,0.855341,0.765534,0.679384,0.610838,0.53496,0.476112,0.417713,0.367625,0.330004,0.310141,0.289966,0.260004,0.230476,0.203704,0.181994,0.161964,0.146007,0.127959,0.112009,0.0961,0.083672,0.073967,0.064002,0.056595,0.051758,0.047883,0.044488]
@@ -1,3 +0,0 @@
-x=[2200.089552,2211.662865,2224.772439,2239.383282,2255.502458,2268.479904,2280.231313,2291.656641,2304.050447,2317.388519,2332.150607,2348.41434,2360.518659,2372.021643,2384.661272,2397.949862,2412.595147,2428.465792,2445.771888,2465.257938,2486.963788,2511.581963,2540.113311,2573.101892,2612.388936,2659.955982,2710.077762,2758.961822,2801.300698,2841.473164,2884.593905,2911.688451,2939.001968,2968.764748,3000.412483,3036.616488,3078.291151,3124.194582,3175.822762,3234.058941,3304.591864,3384.90468,3481.61652,3603.141782,3751.282063,3841.628178,3947.41,4006.54,4137.97,4300.71,4485.11,4701.26,4939.02,5216.2,5570.5,5928.5,6378.9,6888.0,7381.0,7694.6,8050.9,8682.7,9520.1,10467.7,11524.5,12775.5,14077.3,15908.2,18235.9,21681.8,25361.9,29836.6,36294.0,42280.5,47719.8,54757.2,62084.4]
-
-y=[44.920943,41.916522,38.926281,35.925647,32.93558,30.838076,29.045821,27.451224,25.871416,24.304224,22.721228,21.138998,20.063888,19.094295,18.131224,17.169398,16.205601,15.239517,14.269216,13.285389,12.288362,11.279495,10.252208,9.214264,8.173808,7.131629,6.239797,5.52899,5.015307,4.597069,4.208731,3.993533,3.794155,3.595858,3.402858,3.203486,2.998151,2.797974,2.599405,2.402904,2.198169,2.000464,1.801788,1.598387,1.401044,1.301191,1.200443,1.150003,1.050041,0.950056,0.855079,0.765301,0.685064,0.610273,0.535358,0.476577,0.418672,0.368118,0.330007,0.309861,0.290005,0.260065,0.230209,0.204151,0.181877,0.161654,0.145291,0.128027,0.11204,0.095655,0.083457,0.073125,0.063129,0.05682,0.052505,0.048265,0.044585]
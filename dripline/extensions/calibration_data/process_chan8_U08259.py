@@ -1,3 +0,0 @@
-x=[2205.377625,2217.160322,2230.38603,2245.128251,2261.663276,2274.445673,2286.489168,2298.075803,2310.408598,2324.025181,2338.960793,2355.258574,2367.375692,2379.19414,2391.776333,2405.195117,2419.867401,2435.711615,2452.946307,2472.618403,2494.378543,2519.257227,2547.855528,2581.412898,2620.645529,2668.595406,2718.925835,2768.216081,2810.858627,2851.315212,2894.857447,2921.923675,2949.453221,2979.390967,3011.458629,3048.137869,3090.157118,3136.454816,3188.313556,3247.24192,3318.397216,3399.63873,3497.185946,3620.108312,3769.937829,3861.409868,3968.994713,4026.52,4159.22,4320.68,4506.98,4725.27,4966.08,5249.97,5609.69,5980.1,6448.5,6962.2,7476.3,7783.7,8167.4,8841.9,9746.6,10728.9,11795.7,13119.0,14443.8,16533.2,19147.8,23006.8,27337.4,32349.8,39582.5,47496.6,54170.8,62181.0,75457.0]
-
-y=[44.921149,41.916925,38.926416,35.924937,32.936329,30.838004,29.046257,27.452956,25.872743,24.304206,22.721474,21.139433,20.064141,19.094465,18.13097,17.169183,16.205612,15.239518,14.26934,13.285419,12.288912,11.279534,10.252307,9.214555,8.173634,7.131624,6.239793,5.528942,5.015527,4.596899,4.208662,3.993526,3.794172,3.595891,3.402929,3.203425,2.998178,2.797804,2.599417,2.40284,2.198122,2.000323,1.801825,1.598339,1.40103,1.301282,1.200194,1.150318,1.050314,0.950391,0.855268,0.765506,0.685007,0.610493,0.535617,0.476177,0.4182,0.36803,0.330072,0.310142,0.290228,0.260174,0.230151,0.204052,0.182197,0.162309,0.146149,0.128039,0.112102,0.09605,0.083985,0.074038,0.064012,0.057101,0.052422,0.047964,0.044187]
@@ -1,3 +0,0 @@
-x=[2267.5529,2280.4907,2294.5999,2310.5224,2328.3347,2342.2373,2355.3655,2368.0937,2381.8216,2396.738,2413.0397,2430.8428,2443.8332,2456.3891,2470.062,2484.7958,2500.8636,2518.2731,2537.2889,2558.8473,2582.9714,2610.2051,2641.5792,2677.629,2720.4061,2771.8413,2822.0184,2875.6767,2921.3902,2963.9625,3009.8152,3038.1279,3067.2236,3099.6773,3135.0803,3174.4067,3218.2318,3266.9752,3322.9475,3388.1715,3461.2533,3548.1185,3653.4617,3784.0966,3944.1905,4041.1982,4152.28,4215.04,4358.99,4531.23,4729.53,4961.77,5220.1,5517.4,5899.0,6282.3,6760.3,7310.2,7840.8,8177.5,8554.9,9248.8,10133.2,11162.0,12289.0,13611.8,14975.4,17019.2,19475.2,23169.9,27109.9,31866.3,38651.7,45215.6,51161.0,57384.2,66421.0]
-
-y=[45.1527,42.1524,39.1486,36.1368,33.1254,31.0118,29.1886,27.5619,25.939,24.328,22.7252,21.143,20.0768,19.1101,18.1383,17.1666,16.1941,15.2114,14.2253,13.2244,12.211,11.1886,10.1569,9.1234,8.0851,7.0568,6.2347,5.5117,4.9994,4.5895,4.2077,3.9981,3.8,3.5983,3.3985,3.1979,2.9983,2.8001,2.5998,2.3967,2.1999,2.0007,1.7993,1.5956,1.3989,1.2998,1.2008,1.1501,1.0503,0.95034,0.85537,0.76574,0.68504,0.61051,0.53554,0.47629,0.41894,0.36835,0.33001,0.30992,0.29011,0.26014,0.23044,0.20413,0.18186,0.16155,0.14563,0.12756,0.11181,0.095332,0.083247,0.072946,0.063051,0.056777,0.052506,0.048301,0.044556]
@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pyModbusTCP.client
 from dripline.core import Service, ThrowReply
 
@@ -12,12 +15,97 @@ class ModbusService(Service):
     def __init__(self,
                  modbus_host=None,
                  modbus_port=502,
+                 snapshot_max_age=0,
+                 max_block_registers=125,
+                 max_block_gap=8,
                  **kwargs):
+        '''
+        modbus_host (str): PLC host name or address
+        modbus_port (int): Modbus TCP port
+        snapshot_max_age (float): if positive, the registers of all children (those with register and
+            n_registers) are read as a few contiguous blocks and gets within snapshot_max_age seconds are
+            decoded from those values; 0 (default) reads every get's registers directly
+        max_block_registers (int): largest block read in one transaction (125 is the Modbus limit)
+        max_block_gap (int): unused registers between two children's ranges which are still read
+            rather than starting a new block
+        '''
         Service.__init__(self,**kwargs)
         if modbus_host is None:
             raise ThrowReply("modbus_host is a required configuration parameter for <modbus_service>")
         self.modbus_client = pyModbusTCP.client.ModbusClient(host=modbus_host, port=modbus_port, auto_open=True)
+        self.snapshot_max_age = snapshot_max_age
+        self.max_block_registers = max_block_registers
+        self.max_block_gap = max_block_gap
+        self._snapshot = {}
+        self._snapshot_time = None
+        self._snapshot_lock = threading.Lock()
 
     def read_holding(self, register, n_registers):
+        if self.snapshot_max_age > 0:
+            with self._snapshot_lock:
+                if self._snapshot_time is None or time.monotonic() - self._snapshot_time > self.snapshot_max_age:
+                    self._refresh_snapshot()
+                values = [self._snapshot.get(a_register) for a_register in range(register, register + n_registers)]
+            if None not in values:
+                return values
+            # not a child's range, or its block failed to read
         logger.debug('calling read_holding_registers({}, {})'.format(register, n_registers))
         return self.modbus_client.read_holding_registers(register, n_registers)
+
+    def _child_ranges(self):
+        '''
+        Returns the sorted (first register, stop register) ranges read by the children
+        '''
+        ranges = []
+        for child in self.sync_children.values():
+            if hasattr(child, 'register_ranges'):
+                # children reading several separate ranges, e.g. plc_bool_group
+                ranges += child.register_ranges()
+            elif getattr(child, 'register', None) is not None and getattr(child, 'n_registers', None):
+                ranges.append((child.register, child.register + child.n_registers))
+        return sorted(ranges)
+
+    def register_blocks(self, ranges=None):
+        '''
+        Returns the (first register, n_registers) blocks, none longer than max_block_registers,
+        covering every child's registers (or the given (first, stop) ranges)
+        '''
+        if ranges is None:
+            ranges = self._child_ranges()
+        merged = []
+        for start, stop in sorted(ranges):
+            if merged and start <= merged[-1][1] + self.max_block_gap:
+                merged[-1][1] = max(stop, merged[-1][1])
+            else:
+                merged.append([start, stop])
+        blocks = []
+        for start, stop in merged:
+            for chunk_start in range(start, stop, self.max_block_registers):
+                blocks.append((chunk_start, min(self.max_block_registers, stop - chunk_start)))
+        return blocks
+
+    def _refresh_snapshot(self):
+        snapshot = {}
+        ranges = self._child_ranges()
+        for start, n_registers in self.register_blocks(ranges):
+            values = self._read_block(start, n_registers)
+            if values is None:
+                # the block may span registers the PLC does not map; read the children's ranges in it alone
+                stop = start + n_registers
+                for range_start, range_stop in ranges:
+                    if range_start < stop and range_stop > start:
+                        for sub_start, sub_n in self.register_blocks([(max(range_start, start), min(range_stop, stop))]):
+                            sub_values = self._read_block(sub_start, sub_n)
+                            if sub_values is not None:
+                                snapshot.update(zip(range(sub_start, sub_start + sub_n), sub_values))
+                continue
+            snapshot.update(zip(range(start, start + n_registers), values))
+        self._snapshot = snapshot
+        self._snapshot_time = time.monotonic()
+
+    def _read_block(self, start, n_registers):
+        logger.debug('calling read_holding_registers({}, {})'.format(start, n_registers))
+        values = self.modbus_client.read_holding_registers(start, n_registers)
+        if values is None:
+            logger.warning('failed to read registers {} to {}'.format(start, start + n_registers - 1))
+        return values
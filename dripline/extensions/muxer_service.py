@@ -2,10 +2,12 @@
 A class to interface with the multiplexer aka muxer instrument
 '''
 
-from dripline.core import ThrowReply, Entity, calibrate
+from dripline.core import ThrowReply, Entity
 from dripline.implementations import EthernetSCPIService
-from sagebrush.functions import piecewise_cal
-import math
+from sagebrush.functions import BoundCalibrationMixin, CalibrationCurve, CalibrationRegistry, calibrate_bound, single_flight
+import datetime
+import threading
+import time
 
 import logging
 logger = logging.getLogger(__name__)
@@ -18,275 +20,462 @@ _all_calibrations = []
 
 
 # PT 100
-def pt100_cal(resistance):
-    '''Calibration for the (many) muxer pt100 temperature sensor endpoints'''
-    values_x = [2.29, 9.39, 18.52,  39.72,  60.26,  80.31,   100.,  119.4, 138.51]
-    values_y = [20.,   50., 73.15, 123.15, 173.15, 223.15, 273.15, 323.15, 373.15]
-    return piecewise_cal(values_x, values_y, resistance)
+pt100_cal = CalibrationCurve(
+    values_x = [2.29, 9.39, 18.52,  39.72,  60.26,  80.31,   100.,  119.4, 138.51],
+    values_y = [20.,   50., 73.15, 123.15, 173.15, 223.15, 273.15, 323.15, 373.15],
+    name='pt100_cal', doc='Calibration for the (many) muxer pt100 temperature sensor endpoints')
 _all_calibrations.append(pt100_cal)
 
 # Cernox sensors
-def x84971(resistance):
-    '''Calibration for a cernox'''
-    values_x = [82.2, 297.0, 3988.0]
-    values_y = [305.0, 77.0, 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x84971 = CalibrationCurve(
+    values_x = [82.2, 297.0, 3988.0],
+    values_y = [305.0, 77.0, 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x84971', doc='Calibration for a cernox')
 _all_calibrations.append(x84971)
 
-def x76782(resistance):
-    '''Calibration for a cernox'''
-    values_x = [73.9, 251., 2896.]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x76782 = CalibrationCurve(
+    values_x = [73.9, 251., 2896.],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x76782', doc='Calibration for a cernox')
 _all_calibrations.append(x76782)
 
-def x76779p2(resistance):
-    '''Calibration for a cernox'''
-    values_x = [73.2, 246., 2663.6]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x76779p2 = CalibrationCurve(
+    values_x = [73.2, 246., 2663.6],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x76779p2', doc='Calibration for a cernox')
 _all_calibrations.append(x76779p2)
 
-def x41840(resistance):
-    '''Calibration for a cernox'''
-    values_x = [58.8, 243., 5104.]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x41840 = CalibrationCurve(
+    values_x = [58.8, 243., 5104.],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x41840', doc='Calibration for a cernox')
 _all_calibrations.append(x41840)
 
-def x41849(resistance):
-    '''Calibration for a cernox'''
-    values_x = [53.4, 215., 4337.]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x41849 = CalibrationCurve(
+    values_x = [53.4, 215., 4337.],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x41849', doc='Calibration for a cernox')
 _all_calibrations.append(x41849)
 
-def x43022(resistance):
-    '''Calibration for a cernox'''
-    values_x = [68.6, 248., 3771.]
-    values_y = [300., 78., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x43022 = CalibrationCurve(
+    values_x = [68.6, 248., 3771.],
+    values_y = [300., 78., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x43022', doc='Calibration for a cernox')
 _all_calibrations.append(x43022)
 
-def x76868(resistance):
-    '''Calibration for a cernox'''
-    values_x = [44.4499, 107.207, 588.164, 1878.75]
-    values_y = [305.0, 77.35, 4.2, 1.29997]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x76868 = CalibrationCurve(
+    values_x = [44.4499, 107.207, 588.164, 1878.75],
+    values_y = [305.0, 77.35, 4.2, 1.29997],
+    log_x=True, log_y=True, abs_x=True, name='x76868', doc='Calibration for a cernox')
 _all_calibrations.append(x76868)
 
-def x76774(resistance):
-    '''Calibration for a cernox'''
-    values_x = [73.2, 246., 2790., 11779.]
-    values_y = [305., 77., 4.2, 1.3]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x76774 = CalibrationCurve(
+    values_x = [73.2, 246., 2790., 11779.],
+    values_y = [305., 77., 4.2, 1.3],
+    log_x=True, log_y=True, abs_x=True, name='x76774', doc='Calibration for a cernox')
 _all_calibrations.append(x76774)
 
-def x76775(resistance):
-    '''Calibration for a cernox'''
-    values_x = [71.9, 239., 2585., 10822.]
-    values_y = [305., 77., 4.2, 1.3]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x76775 = CalibrationCurve(
+    values_x = [71.9, 239., 2585., 10822.],
+    values_y = [305., 77., 4.2, 1.3],
+    log_x=True, log_y=True, abs_x=True, name='x76775', doc='Calibration for a cernox')
 _all_calibrations.append(x76775)
 
-def x89346_2wirep2(resistance):
-    '''Calibration for a cernox'''
-    values_x = [371.03973388672, 765., 848.89422607422, 6110.41015625, 4243.]
-    values_y = [293., 70., 35., 5.5, 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+# NB: 4.2 K sits below 5.5 K in raw value here, so this table is not monotonic (CalibrationCurve flags it)
+x89346_2wirep2 = CalibrationCurve(
+    values_x = [371.03973388672, 765., 848.89422607422, 6110.41015625, 4243.],
+    values_y = [293., 70., 35., 5.5, 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x89346_2wirep2', doc='Calibration for a cernox')
 _all_calibrations.append(x89346_2wirep2)
 
-def x89346_2wirep3(resistance):
-    '''Calibration for a cernox'''
-    values_x = [7834. , 492., 157.]
-    values_y = [4.2, 77., 305.]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x89346_2wirep3 = CalibrationCurve(
+    values_x = [7834. , 492., 157.],
+    values_y = [4.2, 77., 305.],
+    log_x=True, log_y=True, abs_x=True, name='x89346_2wirep3', doc='Calibration for a cernox')
 _all_calibrations.append(x89346_2wirep3)
 
-def x89346(resistance):
-    '''Calibration for a cernox'''
-    values_x= [7783., 441., 106.]
-    values_y= [4.2, 77., 305.]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x89346 = CalibrationCurve(
+    values_x = [7783., 441., 106.],
+    values_y = [4.2, 77., 305.],
+    log_x=True, log_y=True, abs_x=True, name='x89346', doc='Calibration for a cernox')
 _all_calibrations.append(x89346)
 
-def x84174(resistance):
-    '''Calibration for a cernox'''
-    values_x = [60.8, 187., 1607.]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x84174 = CalibrationCurve(
+    values_x = [60.8, 187., 1607.],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x84174', doc='Calibration for a cernox')
 _all_calibrations.append(x84174)
 
-def x84138(resistance):
-    '''Calibration for a cernox'''
-    values_x = [77.9, 250., 2401.]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x84138 = CalibrationCurve(
+    values_x = [77.9, 250., 2401.],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x84138', doc='Calibration for a cernox')
 _all_calibrations.append(x84138)
 
-def x87830(resistance):
-    '''Calibration for a cernox'''
-    values_x = [70.6, 225., 1870.]
-    values_y = [305., 77., 4.2]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+x87830 = CalibrationCurve(
+    values_x = [70.6, 225., 1870.],
+    values_y = [305., 77., 4.2],
+    log_x=True, log_y=True, abs_x=True, name='x87830', doc='Calibration for a cernox')
 _all_calibrations.append(x87830)
 
 # RuOx sensors
-def RuOx202a(resistance):
-    '''Calibration for a RuOx'''
-    values_x = [2008.5, 2130, 2243.1507919, 2247.82837008, 2252.67165521, 2257.69242943, 2262.90261077, 2268.31490773, 2273.94481798, 2279.80870753, 2285.92402049, 2292.31202231, 2298.99521874, 2305.99750346, 2313.34748079, 2321.07638638, 2329.22021822, 2337.81827044, 2346.91683612, 2356.56678496, 2366.82825705, 2377.76798468, 2389.46691367, 2395.62834041, 2402.01464403, 2408.63984847, 2415.51928432, 2422.6692313, 2430.10802159, 2437.85528088, 2445.93319361, 2454.36562977, 2463.17990092, 2472.40561454, 2482.07710006, 2492.23190591, 2502.91428312, 2514.17316164, 2526.06736559, 2538.66273378, 2552.04016269, 2566.29150584, 2581.5329411, 2597.89797142, 2615.55883889, 2634.71721236, 2655.64428995, 2678.65722169, 2704.16570341, 2732.66352706, 2764.84669842, 2778.92266862, 2793.7502015, 2801.4579521, 2809.36832643, 2825.86689284, 2843.52852376, 2862.62685027, 2883.18617288, 2905.22478212, 2928.99838467, 2954.81636122, 2968.5757862, 2982.95670854, 2998.00687716, 3013.77849689, 3030.32760197, 3047.71832163, 3066.02023264, 3085.31287362, 3105.68291885, 3127.23059199, 3150.06590596, 3174.31753284, 3200.12792484, 3227.66616756, 3257.12144397, 3288.72235472, 3322.72790766, 3359.45759811, 3399.27876097, 3442.65523479, 3490.12848945, 3542.39690771, 3600.2885489, 3664.89413383, 3737.51755467, 3819.87129619, 3914.02777317, 4022.75310485, 4083.59510837, 4149.45062312, 4220.96353588, 4298.96074351, 4384.44214969, 4478.77921405, 4583.74002105, 4701.99100529, 4836.59753612, 4990.611791, 5166.85835176, 5369.38032441, 5611.83504012, 5903.84561811, 6038.02877119, 6184.22615218, 6344.068314, 6519.43869339, 6712.75769848, 6926.90774683, 7165.50302782, 7432.9462211, 7735.1128401, 8079.35355643, 8270.27720363, 8475.69626238, 8697.52271613, 8937.92669063, 9199.42217175, 9485.27250376, 9799.25139812, 10145.8475355, 10531.1357652, 10962.3265779, 11448.087719, 11999.9339566, 12632.1906056, 13363.5119791, 14217.3470276, 15224.3774852, 16425.034128, 17877.7531888, 19665.2816715, 21927.1350297, 23308.1186795, 24920.4604245, 26839.0366817, 29185.9753819, 32137.3219905, 35958.554143, 40977.9945386, 47523.915336, 56177.874649, 69191.1003872]
-    values_y = [305.0, 77.0, 40.0, 39.0, 38.0, 37.0, 36.0, 35.0, 34.0, 33.0, 32.0, 31.0, 30.0, 29.0, 28.0, 27.0, 26.0, 25.0, 24.0, 23.0, 22.0, 21.0, 20.0, 19.5, 19.0, 18.5, 18.0, 17.5, 17.0, 16.5, 16.0, 15.5, 15.0, 14.5, 14.0, 13.5, 13.0, 12.5, 12.0, 11.5, 11.0, 10.5, 10.0, 9.5, 9.0, 8.5, 8.0, 7.5, 7.0, 6.5, 6.0, 5.8, 5.6, 5.5, 5.4, 5.2, 5.0, 4.8, 4.6, 4.4, 4.2, 4.0, 3.9, 3.8, 3.7, 3.6, 3.5, 3.4, 3.3, 3.2, 3.1, 3.0, 2.9, 2.8, 2.7, 2.6, 2.5, 2.4, 2.3, 2.2, 2.1, 2.0, 1.9, 1.8, 1.7, 1.6, 1.5, 1.4, 1.3, 1.2, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.7, 0.65, 0.6, 0.55, 0.5, 0.48, 0.46, 0.44, 0.42, 0.4, 0.38, 0.36, 0.34, 0.32, 0.3, 0.29, 0.28, 0.27, 0.26, 0.25, 0.24, 0.23, 0.22, 0.21, 0.2, 0.19, 0.18, 0.17, 0.16, 0.15, 0.14, 0.13, 0.12, 0.11, 0.1, 0.095, 0.09, 0.085, 0.08, 0.075, 0.07, 0.065, 0.06, 0.055, 0.05]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+RuOx202a = CalibrationCurve(
+    values_x = [2008.5, 2130, 2243.1507919, 2247.82837008, 2252.67165521, 2257.69242943, 2262.90261077, 2268.31490773, 2273.94481798, 2279.80870753, 2285.92402049, 2292.31202231, 2298.99521874, 2305.99750346, 2313.34748079, 2321.07638638, 2329.22021822, 2337.81827044, 2346.91683612, 2356.56678496, 2366.82825705, 2377.76798468, 2389.46691367, 2395.62834041, 2402.01464403, 2408.63984847, 2415.51928432, 2422.6692313, 2430.10802159, 2437.85528088, 2445.93319361, 2454.36562977, 2463.17990092, 2472.40561454, 2482.07710006, 2492.23190591, 2502.91428312, 2514.17316164, 2526.06736559, 2538.66273378, 2552.04016269, 2566.29150584, 2581.5329411, 2597.89797142, 2615.55883889, 2634.71721236, 2655.64428995, 2678.65722169, 2704.16570341, 2732.66352706, 2764.84669842, 2778.92266862, 2793.7502015, 2801.4579521, 2809.36832643, 2825.86689284, 2843.52852376, 2862.62685027, 2883.18617288, 2905.22478212, 2928.99838467, 2954.81636122, 2968.5757862, 2982.95670854, 2998.00687716, 3013.77849689, 3030.32760197, 3047.71832163, 3066.02023264, 3085.31287362, 3105.68291885, 3127.23059199, 3150.06590596, 3174.31753284, 3200.12792484, 3227.66616756, 3257.12144397, 3288.72235472, 3322.72790766, 3359.45759811, 3399.27876097, 3442.65523479, 3490.12848945, 3542.39690771, 3600.2885489, 3664.89413383, 3737.51755467, 3819.87129619, 3914.02777317, 4022.75310485, 4083.59510837, 4149.45062312, 4220.96353588, 4298.96074351, 4384.44214969, 4478.77921405, 4583.74002105, 4701.99100529, 4836.59753612, 4990.611791, 5166.85835176, 5369.38032441, 5611.83504012, 5903.84561811, 6038.02877119, 6184.22615218, 6344.068314, 6519.43869339, 6712.75769848, 6926.90774683, 7165.50302782, 7432.9462211, 7735.1128401, 8079.35355643, 8270.27720363, 8475.69626238, 8697.52271613, 8937.92669063, 9199.42217175, 9485.27250376, 9799.25139812, 10145.8475355, 10531.1357652, 10962.3265779, 11448.087719, 11999.9339566, 12632.1906056, 13363.5119791, 14217.3470276, 15224.3774852, 16425.034128, 17877.7531888, 19665.2816715, 21927.1350297, 23308.1186795, 24920.4604245, 26839.0366817, 29185.9753819, 32137.3219905, 35958.554143, 40977.9945386, 47523.915336, 56177.874649, 69191.1003872],
+    values_y = [305.0, 77.0, 40.0, 39.0, 38.0, 37.0, 36.0, 35.0, 34.0, 33.0, 32.0, 31.0, 30.0, 29.0, 28.0, 27.0, 26.0, 25.0, 24.0, 23.0, 22.0, 21.0, 20.0, 19.5, 19.0, 18.5, 18.0, 17.5, 17.0, 16.5, 16.0, 15.5, 15.0, 14.5, 14.0, 13.5, 13.0, 12.5, 12.0, 11.5, 11.0, 10.5, 10.0, 9.5, 9.0, 8.5, 8.0, 7.5, 7.0, 6.5, 6.0, 5.8, 5.6, 5.5, 5.4, 5.2, 5.0, 4.8, 4.6, 4.4, 4.2, 4.0, 3.9, 3.8, 3.7, 3.6, 3.5, 3.4, 3.3, 3.2, 3.1, 3.0, 2.9, 2.8, 2.7, 2.6, 2.5, 2.4, 2.3, 2.2, 2.1, 2.0, 1.9, 1.8, 1.7, 1.6, 1.5, 1.4, 1.3, 1.2, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.7, 0.65, 0.6, 0.55, 0.5, 0.48, 0.46, 0.44, 0.42, 0.4, 0.38, 0.36, 0.34, 0.32, 0.3, 0.29, 0.28, 0.27, 0.26, 0.25, 0.24, 0.23, 0.22, 0.21, 0.2, 0.19, 0.18, 0.17, 0.16, 0.15, 0.14, 0.13, 0.12, 0.11, 0.1, 0.095, 0.09, 0.085, 0.08, 0.075, 0.07, 0.065, 0.06, 0.055, 0.05],
+    log_x=True, log_y=True, abs_x=True, name='RuOx202a', doc='Calibration for a RuOx')
 _all_calibrations.append(RuOx202a)
 
-def RuOx102a2(resistance):
-    '''Calibration for a RuOx'''
-    values_x = [1001.457, 1049.084821, 1050.134248, 1051.234436, 1052.390136, 1053.606421, 1054.888644, 1056.243185, 1057.676999, 1059.198157, 1060.815407, 1062.539058, 1064.38032, 1066.352388, 1068.469693, 1070.749315, 1073.209983, 1075.873923, 1078.765815, 1081.915923, 1085.357865, 1089.133117, 1091.160926, 1093.291746, 1095.533606, 1097.895843, 1100.388624, 1103.023917, 1105.814816, 1108.77684, 1111.927001, 1115.285453, 1118.874253, 1122.719262, 1126.848597, 1131.294538, 1136.091908, 1141.279985, 1146.901466, 1153.006101, 1159.651242, 1166.914569, 1174.892047, 1183.729192, 1193.602217, 1204.749899, 1217.387866, 1231.550801, 1247.555875, 1266.577909, 1275.009829, 1283.981548, 1293.598717, 1303.938409, 1315.072734, 1327.083484, 1340.082629, 1354.198663, 1369.584452, 1386.413226, 1395.434894, 1404.902528, 1414.850356, 1425.317761, 1436.34781, 1447.990209, 1460.299587, 1473.339586, 1487.180513, 1501.904756, 1517.603674, 1534.384654, 1552.367053, 1571.690996, 1592.512433, 1615.01362, 1639.39797, 1665.903196, 1694.797923, 1726.404524, 1761.101101, 1799.379277, 1841.854094, 1889.421115, 1943.25369, 2005.176674, 2077.479961, 2162.932548, 2211.300018, 2263.645311, 2320.08459, 2380.766505, 2446.939292, 2523.006605, 2609.096455, 2704.598442, 2812.424605, 2936.56535, 3080.725123, 3250.526173, 3453.501016, 3700.518459, 3815.025036, 3940.325984, 4078.034019, 4230.017884, 4398.490695, 4586.345291, 4797.016459, 5034.682083, 5304.975959, 5615.030288, 5787.871933, 5974.483538, 6176.700265, 6396.627086, 6636.72171, 6900.156905, 7190.651688, 7512.681341, 7872.352068, 8277.055764, 8735.858457, 9261.107013, 9868.5957, 10579.59141, 11421.60916, 12431.61257, 13658.21729, 15165.46324, 17039.12911, 19400.46809, 20820.34136, 22443.68027, 24330.67681, 26563.61824, 29253.30998, 32601.28279, 37123.89615, 43515.77963, 52106.70612, 63765.09333]
-    values_y = [290.0, 40.0, 39.0, 38.0, 37.0, 36.0, 35.0, 34.0, 33.0, 32.0, 31.0, 30.0, 29.0, 28.0, 27.0, 26.0, 25.0, 24.0, 23.0, 22.0, 21.0, 20.0, 19.5, 19.0, 18.5, 18.0, 17.5, 17.0, 16.5, 16.0, 15.5, 15.0, 14.5, 14.0, 13.5, 13.0, 12.5, 12.0, 11.5, 11.0, 10.5, 10.0, 9.5, 9.0, 8.5, 8.0, 7.5, 7.0, 6.5, 6.0, 5.8, 5.6, 5.4, 5.2, 5.0, 4.8, 4.6, 4.4, 4.2, 4.0, 3.9, 3.8, 3.7, 3.6, 3.5, 3.4, 3.3, 3.2, 3.1, 3.0, 2.9, 2.8, 2.7, 2.6, 2.5, 2.4, 2.3, 2.2, 2.1, 2.0, 1.9, 1.8, 1.7, 1.6, 1.5, 1.4, 1.3, 1.2, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.7, 0.65, 0.6, 0.55, 0.5, 0.48, 0.46, 0.44, 0.42, 0.4, 0.38, 0.36, 0.34, 0.32, 0.3, 0.29, 0.28, 0.27, 0.26, 0.25, 0.24, 0.23, 0.22, 0.21, 0.2, 0.19, 0.18, 0.17, 0.16, 0.15, 0.14, 0.13, 0.12, 0.11, 0.1, 0.095, 0.09, 0.085, 0.08, 0.075, 0.07, 0.065, 0.06, 0.055, 0.05]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+RuOx102a2 = CalibrationCurve(
+    values_x = [1001.457, 1049.084821, 1050.134248, 1051.234436, 1052.390136, 1053.606421, 1054.888644, 1056.243185, 1057.676999, 1059.198157, 1060.815407, 1062.539058, 1064.38032, 1066.352388, 1068.469693, 1070.749315, 1073.209983, 1075.873923, 1078.765815, 1081.915923, 1085.357865, 1089.133117, 1091.160926, 1093.291746, 1095.533606, 1097.895843, 1100.388624, 1103.023917, 1105.814816, 1108.77684, 1111.927001, 1115.285453, 1118.874253, 1122.719262, 1126.848597, 1131.294538, 1136.091908, 1141.279985, 1146.901466, 1153.006101, 1159.651242, 1166.914569, 1174.892047, 1183.729192, 1193.602217, 1204.749899, 1217.387866, 1231.550801, 1247.555875, 1266.577909, 1275.009829, 1283.981548, 1293.598717, 1303.938409, 1315.072734, 1327.083484, 1340.082629, 1354.198663, 1369.584452, 1386.413226, 1395.434894, 1404.902528, 1414.850356, 1425.317761, 1436.34781, 1447.990209, 1460.299587, 1473.339586, 1487.180513, 1501.904756, 1517.603674, 1534.384654, 1552.367053, 1571.690996, 1592.512433, 1615.01362, 1639.39797, 1665.903196, 1694.797923, 1726.404524, 1761.101101, 1799.379277, 1841.854094, 1889.421115, 1943.25369, 2005.176674, 2077.479961, 2162.932548, 2211.300018, 2263.645311, 2320.08459, 2380.766505, 2446.939292, 2523.006605, 2609.096455, 2704.598442, 2812.424605, 2936.56535, 3080.725123, 3250.526173, 3453.501016, 3700.518459, 3815.025036, 3940.325984, 4078.034019, 4230.017884, 4398.490695, 4586.345291, 4797.016459, 5034.682083, 5304.975959, 5615.030288, 5787.871933, 5974.483538, 6176.700265, 6396.627086, 6636.72171, 6900.156905, 7190.651688, 7512.681341, 7872.352068, 8277.055764, 8735.858457, 9261.107013, 9868.5957, 10579.59141, 11421.60916, 12431.61257, 13658.21729, 15165.46324, 17039.12911, 19400.46809, 20820.34136, 22443.68027, 24330.67681, 26563.61824, 29253.30998, 32601.28279, 37123.89615, 43515.77963, 52106.70612, 63765.09333],
+    values_y = [290.0, 40.0, 39.0, 38.0, 37.0, 36.0, 35.0, 34.0, 33.0, 32.0, 31.0, 30.0, 29.0, 28.0, 27.0, 26.0, 25.0, 24.0, 23.0, 22.0, 21.0, 20.0, 19.5, 19.0, 18.5, 18.0, 17.5, 17.0, 16.5, 16.0, 15.5, 15.0, 14.5, 14.0, 13.5, 13.0, 12.5, 12.0, 11.5, 11.0, 10.5, 10.0, 9.5, 9.0, 8.5, 8.0, 7.5, 7.0, 6.5, 6.0, 5.8, 5.6, 5.4, 5.2, 5.0, 4.8, 4.6, 4.4, 4.2, 4.0, 3.9, 3.8, 3.7, 3.6, 3.5, 3.4, 3.3, 3.2, 3.1, 3.0, 2.9, 2.8, 2.7, 2.6, 2.5, 2.4, 2.3, 2.2, 2.1, 2.0, 1.9, 1.8, 1.7, 1.6, 1.5, 1.4, 1.3, 1.2, 1.15, 1.1, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.7, 0.65, 0.6, 0.55, 0.5, 0.48, 0.46, 0.44, 0.42, 0.4, 0.38, 0.36, 0.34, 0.32, 0.3, 0.29, 0.28, 0.27, 0.26, 0.25, 0.24, 0.23, 0.22, 0.21, 0.2, 0.19, 0.18, 0.17, 0.16, 0.15, 0.14, 0.13, 0.12, 0.11, 0.1, 0.095, 0.09, 0.085, 0.08, 0.075, 0.07, 0.065, 0.06, 0.055, 0.05],
+    log_x=True, log_y=True, abs_x=True, name='RuOx102a2', doc='Calibration for a RuOx')
 _all_calibrations.append(RuOx102a2)
 
 # Magnet Temps
-def magnet_t1p2(resistance):
-    '''Calibration for a cernox'''
-    values_x = [4.2, 50., 150.]
-    values_y = [1755.75, 261.892, 72.4254]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+magnet_t1p2 = CalibrationCurve(
+    values_x = [4.2, 50., 150.],
+    values_y = [1755.75, 261.892, 72.4254],
+    log_x=True, log_y=True, abs_x=True, name='magnet_t1p2', doc='Calibration for a cernox')
 _all_calibrations.append(magnet_t1p2)
 
-def magnet_t2p2(resistance):
-    '''Calibration for a cernox'''
-    values_x = [4.2, 50., 150.]
-    values_y = [1346.27, 240.923, 62.171]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+magnet_t2p2 = CalibrationCurve(
+    values_x = [4.2, 50., 150.],
+    values_y = [1346.27, 240.923, 62.171],
+    log_x=True, log_y=True, abs_x=True, name='magnet_t2p2', doc='Calibration for a cernox')
 _all_calibrations.append(magnet_t2p2)
 
-def magnet_t3p2(resistance):
-    '''Calibration for a cernox'''
-    values_x = [4.21, 50., 150.]
-    values_y = [1495., 225.333, 62.59]
-    return piecewise_cal(values_x, values_y, abs(resistance), log_x=True, log_y=True)
+magnet_t3p2 = CalibrationCurve(
+    values_x = [4.21, 50., 150.],
+    values_y = [1495., 225.333, 62.59],
+    log_x=True, log_y=True, abs_x=True, name='magnet_t3p2', doc='Calibration for a cernox')
 _all_calibrations.append(magnet_t3p2)
 
 # other pressures
-def capacitance_manometer_10_offset(volts):
-    ''' little pot pressure '''
-    values_x = [0., 10., 15., 20.]
-    values_y = [-0.16, 9.84, 14.84, 14.84]
-    return piecewise_cal(values_x, values_y, volts)
+capacitance_manometer_10_offset = CalibrationCurve(
+    values_x = [0., 10., 15., 20.],
+    values_y = [-0.16, 9.84, 14.84, 14.84],
+    name='capacitance_manometer_10_offset', doc='little pot pressure')
 _all_calibrations.append(capacitance_manometer_10_offset)
 
-def capacitance_manometer_10(volts):
-    ''' little pot pressure '''
-    values_x = [0., 10., 15., 20.]
-    values_y = [0., 10., 15., 15.]
-    return piecewise_cal(values_x, values_y, volts)
+capacitance_manometer_10 = CalibrationCurve(
+    values_x = [0., 10., 15., 20.],
+    values_y = [0., 10., 15., 15.],
+    name='capacitance_manometer_10', doc='little pot pressure')
 _all_calibrations.append(capacitance_manometer_10)
 
-def gp358i(volts):
-    ''' insulation pressure ion '''
-    values_x = [0., 10.]
-    values_y = [1e-11, 0.1]
-    return piecewise_cal(values_x, values_y, volts, log_y=True)
+gp358i = CalibrationCurve(
+    values_x = [0., 10.],
+    values_y = [1e-11, 0.1],
+    log_y=True, name='gp358i', doc='insulation pressure ion')
 _all_calibrations.append(gp358i)
 
-def gp358c(volts):
-    ''' insulation pressure ion '''
-    values_x = [0., 7.]
-    values_y = [0.0001, 1000.]
-    return piecewise_cal(values_x, values_y, volts, log_y=True)
+gp358c = CalibrationCurve(
+    values_x = [0., 7.],
+    values_y = [0.0001, 1000.],
+    log_y=True, name='gp358c', doc='insulation pressure ion')
 _all_calibrations.append(gp358c)
 
-def super_bee(volts):
-    ''' insulation pressure ion '''
-    values_x = [1., 1.301, 1.699, 2., 2.301, 2.699, 3., 3.301, 3.699, 4., 4.301, 4.699, 5., 5.301, 5.699, 6., 6.301, 6.699, 7., 7.301, 7.477, 7.602, 7.699, 7.778, 7.845, 7.881, 7.903, 7.954, 8.]
-    values_y = [0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1., 2., 5., 10., 20., 50., 100., 200., 300., 400., 500., 600., 700., 760., 800., 900., 1000.]
-    return piecewise_cal(values_x, values_y, volts, log_y=True)
+super_bee = CalibrationCurve(
+    values_x = [1., 1.301, 1.699, 2., 2.301, 2.699, 3., 3.301, 3.699, 4., 4.301, 4.699, 5., 5.301, 5.699, 6., 6.301, 6.699, 7., 7.301, 7.477, 7.602, 7.699, 7.778, 7.845, 7.881, 7.903, 7.954, 8.],
+    values_y = [0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1., 2., 5., 10., 20., 50., 100., 200., 300., 400., 500., 600., 700., 760., 800., 900., 1000.],
+    log_y=True, name='super_bee', doc='insulation pressure ion')
 _all_calibrations.append(super_bee)
 
 # Hall Probe
-def HGCA3020(resistance):
-    '''Calibration for a Hall Probe'''
-    values_x = [-0.02895958, -0.01930098, -0.00964152, 0., 0.00963079, 0.01929507, 0.02898745]
-    values_y = [-30., -20., -10., 0., 10., 20., 30]
-    return piecewise_cal(values_x, values_y, resistance)
+HGCA3020 = CalibrationCurve(
+    values_x = [-0.02895958, -0.01930098, -0.00964152, 0., 0.00963079, 0.01929507, 0.02898745],
+    values_y = [-30., -20., -10., 0., 10., 20., 30],
+    name='HGCA3020', doc='Calibration for a Hall Probe')
 _all_calibrations.append(HGCA3020)
 
-def HGCT3020(resistance):
-    '''Calibration for a Hall Probe'''
-    values_x = [-0.02613, -0.01744, -0.0087197, 0., 0.00873, 0.017463, 0.02617]
-    values_y = [-30., -20., -10., 0., 10., 20., 30]
-    return piecewise_cal(values_x, values_y, resistance)
+HGCT3020 = CalibrationCurve(
+    values_x = [-0.02613, -0.01744, -0.0087197, 0., 0.00873, 0.017463, 0.02617],
+    values_y = [-30., -20., -10., 0., 10., 20., 30],
+    name='HGCT3020', doc='Calibration for a Hall Probe')
 _all_calibrations.append(HGCT3020)
 
 # Flow Meters
-def flow_meter_1k_pot(volts):
-    '''Calibration for a 1k pot flow meter'''
-    values_x = [0.0, 2.5, 5.0]
-    values_y = [0.0, 1.811, 3.622]
-    return piecewise_cal(values_x, values_y, volts)
+flow_meter_1k_pot = CalibrationCurve(
+    values_x = [0.0, 2.5, 5.0],
+    values_y = [0.0, 1.811, 3.622],
+    name='flow_meter_1k_pot', doc='Calibration for a 1k pot flow meter')
 _all_calibrations.append(flow_meter_1k_pot)
 
-def flow_meter_main_magnet(volts):
-    '''Calibration for a 1k pot flow meter'''
-    values_x = [0.0, 2.5, 5.0]
-    values_y = [0.0, 18.11, 36.22]
-    return piecewise_cal(values_x, values_y, volts)
+flow_meter_main_magnet = CalibrationCurve(
+    values_x = [0.0, 2.5, 5.0],
+    values_y = [0.0, 18.11, 36.22],
+    name='flow_meter_main_magnet', doc='Calibration for a 1k pot flow meter')
 _all_calibrations.append(flow_meter_main_magnet)
 
-def flow_meter_insert(volts):
-    '''Calibration for a 1k pot flow meter'''
-    values_x = [0.0, 2.5, 5.0]
-    values_y = [0.0, 9.055, 18.11]
-    return piecewise_cal(values_x, values_y, volts)
+flow_meter_insert = CalibrationCurve(
+    values_x = [0.0, 2.5, 5.0],
+    values_y = [0.0, 9.055, 18.11],
+    name='flow_meter_insert', doc='Calibration for a 1k pot flow meter')
 _all_calibrations.append(flow_meter_insert)
 
+_calibrations = CalibrationRegistry(_all_calibrations)
+
 
 class MuxerService(EthernetSCPIService):
     '''
     Provider to interface with muxer
     '''
 
-    def __init__(self, scan_interval=0,**kwargs):
+    def __init__(self, scan_interval=0, snapshot_max_age=None, stream_interval=0, stream_max_readings=5000, **kwargs):
         '''
         scan_interval (int): time between scans in seconds
+        snapshot_max_age (float): age in seconds beyond which a get re-reads the whole scan list, in a
+            single query, rather than using the stored readings; defaults to half of scan_interval,
+            and 0 disables the snapshot so that every get queries its own channel
+        stream_interval (float): if > 0, run in streaming mode: every stream_interval seconds drain the
+            instrument's reading memory and publish every reading with its instrument timestamp
+            (rather than logging each endpoint's last reading every scan_interval)
+        stream_max_readings (int): maximum number of readings to drain in one exchange
         '''
         EthernetSCPIService.__init__(self,**kwargs)
         if scan_interval <= 0:
             raise ThrowReply('service_error_invalid_value', 'scan interval must be > 0')
         self.scan_interval = scan_interval
+        self.snapshot_max_age = scan_interval / 2. if snapshot_max_age is None else snapshot_max_age
+        self._scan_channels = []
+        self._snapshot = {}
+        self._snapshot_cal = {}
+        self._snapshot_time = None
+        self._snapshot_lock = threading.Lock()
+        self.stream_interval = stream_interval
+        self.stream_max_readings = stream_max_readings
+        self._channel_children = {}
+        self._stream_stop = threading.Event()
+        self._stream_thread = None
         self.configure_scan()
 
     def configure_scan(self, *args, **kwargs):
         '''
-        loops over the provider's internal list of endpoints and attempts to configure each, then configures and begins scan
+        configures all of the provider's endpoints and the scan in one exchange, then begins scan
+
+        Endpoints sharing a conf_str are configured with a single command over their channel list, and
+        the error queue is checked once at the end; if it reports an error, the endpoints are configured
+        one at a time to find the one responsible.
         '''
+        self._stop_stream()
         self.send_to_device(['ABOR;*CLS;*OPC?'])
 
-        ch_scan_list = list()
-        for childname, child in self.sync_children.items():
-
-            if not isinstance(child, MuxerGetEntity):
-                continue
+        children = {childname: child for childname, child in self.sync_children.items() if isinstance(child, MuxerGetEntity)}
+        ch_scan_list = [str(child.ch_number) for child in children.values()]
+        for childname, child in children.items():
+            # when streaming, the stream publishes every reading in place of the scheduled logs
+            child.log_interval = 0 if self.stream_interval > 0 else self.scan_interval
+            if self.stream_interval > 0 and child._calibration is not None and child._bound_calibration is None:
+                raise ThrowReply('service_error_invalid_value',
+                                 f'streaming requires endpoint <{childname}> to use a named calibration, not <{child._calibration}>')
+
+        conf_cmds = self._grouped_conf_commands(children.values())
+        scan_cmds = ['ROUT:SCAN (@{})'.format(','.join(ch_scan_list)),
+                     'TRIG:SOUR TIM',
+                     'TRIG:COUN INF',
+                     'TRIG:TIM {}'.format(self.scan_interval)]
+        if self.stream_interval > 0:
+            # timestamped readings (reading,YYYY,MM,DD,hh,mm,ss.sss,channel), with the clock set to UTC
+            now = datetime.datetime.now(datetime.timezone.utc)
+            scan_cmds += ['FORM:READ:TIME ON',
+                          'FORM:READ:TIME:TYPE ABS',
+                          'FORM:READ:CHAN ON',
+                          'FORM:READ:UNIT OFF',
+                          'FORM:READ:ALAR OFF',
+                          now.strftime('SYST:DATE %Y,%m,%d'),
+                          'SYST:TIME {},{},{:.3f}'.format(now.hour, now.minute, now.second + now.microsecond * 1e-6)]
+        error_data = self.send_to_device([';:'.join(conf_cmds + scan_cmds) + ';*OPC?;:SYST:ERR?'])
+        if error_data != '1;+0,"No error"':
+            logger.warning(f'{error_data} when configuring the muxer in one batch; configuring endpoints individually')
+            self._configure_individually(children)
+            error_data = self.send_to_device([';:'.join(scan_cmds) + ';*OPC?;:SYST:ERR?'])
+            if error_data != '1;+0,"No error"':
+                logger.critical('Error detected; cannot configure muxer')
+                raise ThrowReply('resource_error', f'{error_data} when attempting to configure the scan')
+
+        with self._snapshot_lock:
+            self._scan_channels = ch_scan_list
+            self._snapshot = {}
+            self._snapshot_cal = {}
+            self._snapshot_time = None
+        self._channel_children = {str(child.ch_number): child for child in children.values()}
+
+        self.send_to_device(['INIT;*ESE?'])
+        if self.stream_interval > 0:
+            self._stream_stop.clear()
+            self._stream_thread = threading.Thread(target=self._stream_loop, name=f'{self.name}_stream', daemon=True)
+            self._stream_thread.start()
+
+    @staticmethod
+    def _grouped_conf_commands(children):
+        '''
+        one configuration command per distinct conf_str, covering every channel which uses it
+        (conf_str with the channel anywhere other than a single "(@{})" channel list are sent as they are)
+        '''
+        grouped = {}
+        conf_cmds = []
+        for child in children:
+            template = child.conf_template
+            if template.count('{}') == 1 and '(@{})' in template:
+                grouped.setdefault(template, []).append(str(child.ch_number))
+            else:
+                conf_cmds.append(child.conf_str)
+        conf_cmds += [template.format(','.join(channels)) for template, channels in grouped.items()]
+        return conf_cmds
+
+    def _configure_individually(self, children):
+        '''
+        configures endpoints one at a time, raising for the first whose configuration is rejected
+        '''
+        self.send_to_device(['ABOR;*CLS;*OPC?'])
+        for childname, child in children.items():
             error_data = self.send_to_device([child.conf_str+';*OPC?','SYST:ERR?'])
             if error_data != '1;+0,"No error"':
                 logger.critical('Error detected; cannot configure muxer')
                 raise ThrowReply('resource_error',
                                 f'{error_data} when attempting to configure endpoint <{childname}>')
 
-            ch_scan_list.append(str(child.ch_number))
-            child.log_interval = self.scan_interval
+    def _stop_stream(self):
+        if self._stream_thread is not None:
+            self._stream_stop.set()
+            self._stream_thread.join()
+            self._stream_thread = None
+
+    def _stream_loop(self):
+        while not self._stream_stop.wait(self.stream_interval):
+            try:
+                self.drain_readings()
+            except Exception as err:
+                logger.error(f'failed to drain muxer readings: {err}')
 
-        scan_list_cmd = 'ROUT:SCAN (@{})'.format(','.join(ch_scan_list))
-        self.send_to_device([scan_list_cmd+';*OPC?',\
-                   'TRIG:SOUR TIM;*OPC?',\
-                   'TRIG:COUN INF;*OPC?',\
-                   'TRIG:TIM {};*OPC?'.format(self.scan_interval),\
-                   'INIT;*ESE?'])
+    def drain_readings(self):
+        '''
+        Reads (and erases) up to stream_max_readings buffered readings, calibrates each channel's
+        readings as one batch, and publishes every reading with its instrument timestamp.
+        The newest reading of each channel also becomes the scan snapshot.
+        Returns the number of readings published.
+        '''
+        with self._snapshot_lock:
+            block = self.send_to_device([f'R? {self.stream_max_readings}'])
+            readings = self._parse_readings_block(block)
+            by_channel = {}
+            for ch, timestamp, raw in readings:
+                by_channel.setdefault(ch, []).append((timestamp, raw))
+            calibrated = self._calibrate_scan({ch: [raw for _, raw in channel_readings]
+                                               for ch, channel_readings in by_channel.items()})
+            if by_channel:
+                self._snapshot.update({ch: channel_readings[-1][1] for ch, channel_readings in by_channel.items()})
+                self._snapshot_cal.update({ch: values_cal[-1] for ch, values_cal in calibrated.items()})
+                self._snapshot_time = time.monotonic()
+        if not readings:
+            return 0
+
+        for ch, channel_readings in by_channel.items():
+            child = self._channel_children.get(ch)
+            if child is None:
+                logger.warning(f'dropping {len(channel_readings)} readings from channel {ch}, which has no endpoint')
+                continue
+            values_cal = calibrated.get(ch)
+            for i, (timestamp, raw) in enumerate(channel_readings):
+                value = {'value_raw': raw, 'timestamp': timestamp}
+                if values_cal is not None:
+                    value['value_cal'] = values_cal[i]
+                child.log_a_value(value)
+        logger.debug(f'published {len(readings)} streamed readings')
+        return len(readings)
+
+    @staticmethod
+    def _parse_readings_block(block):
+        '''
+        Splits the reply to R? (an IEEE 488.2 definite length block of timestamped readings) into
+        a list of (channel, timestamp string, raw reading) in the order they were taken
+        '''
+        block = block.strip()
+        if block.startswith('#'):
+            n_digits = int(block[1])
+            block = block[2 + n_digits:]
+        if not block:
+            return []
+        fields = block.split(',')
+        if len(fields) % 8:
+            raise ThrowReply('resource_error', f'unexpected format of buffered readings: <{block[:100]}>')
+        readings = []
+        for i in range(0, len(fields), 8):
+            raw, year, month, day, hour, minute, second, ch = fields[i:i+8]
+            timestamp = datetime.datetime(int(year), int(month), int(day), int(hour), int(minute)) + datetime.timedelta(seconds=float(second))
+            readings.append((str(int(ch)), timestamp.strftime('%Y-%m-%dT%H:%M:%S.%fZ'), raw))
+        return readings
+
+    def channel_reading(self, ch_number, max_age=None):
+        '''
+        Latest reading of a channel, served from the scan snapshot when it is younger than max_age
+
+        ch_number (int): channel to read
+        max_age (float): maximum snapshot age in seconds, defaults to snapshot_max_age
+        Returns (raw reading, calibrated value), where the calibrated value is None unless it was
+        computed with the rest of the scan (see _calibrate_scan)
+        '''
+        if max_age is None:
+            max_age = self.snapshot_max_age
+        ch = str(ch_number)
+        if max_age <= 0 or ch not in self._scan_channels:
+            return self._reading_value(self.send_to_device([f'DATA:LAST? (@{ch})'])), None
+        if self.stream_interval > 0:
+            if self._snapshot_time is None or time.monotonic() - self._snapshot_time > max_age:
+                self.drain_readings()
+            if ch in self._snapshot:
+                return self._snapshot[ch], self._snapshot_cal.get(ch)
+            raise ThrowReply('resource_error_no_response', f'no reading streamed yet for channel {ch}')
+        with self._snapshot_lock:
+            if self._snapshot_time is None or time.monotonic() - self._snapshot_time > max_age:
+                self._refresh_snapshot()
+            return self._snapshot[ch], self._snapshot_cal.get(ch)
+
+    @staticmethod
+    def _reading_value(reading):
+        # drop the units and any comma separated timestamp/channel fields
+        return reading.split()[0].split(',')[0]
+
+    def _calibrate_scan(self, raw_readings):
+        '''
+        Calibrates the readings of every channel, converting all readings of the channels which share
+        a calibration curve together as one array
+
+        raw_readings (dict): list of raw readings by channel
+        Returns the list of calibrated values by channel, for channels whose endpoint has a bound CalibrationCurve
+        '''
+        by_curve = {}
+        for ch, raws in raw_readings.items():
+            child = self._channel_children.get(ch)
+            if child is not None and isinstance(child._bound_calibration, CalibrationCurve):
+                by_curve.setdefault(child._bound_calibration, []).append(ch)
+        calibrated = {}
+        for curve, channels in by_curve.items():
+            values_cal = curve.evaluate([float(raw) for ch in channels for raw in raw_readings[ch]]).tolist()
+            for ch in channels:
+                n_readings = len(raw_readings[ch])
+                calibrated[ch], values_cal = values_cal[:n_readings], values_cal[n_readings:]
+        return calibrated
+
+    def _refresh_snapshot(self):
+        '''
+        Read the last reading of every scanned channel with one compound query
+        '''
+        query = ';:'.join(f'DATA:LAST? (@{ch})' for ch in self._scan_channels)
+        result = self.send_to_device([query])
+        readings = result.split(';')
+        if len(readings) != len(self._scan_channels):
+            raise ThrowReply('resource_error',
+                             f'expected {len(self._scan_channels)} readings from the scan snapshot, got <{result}>')
+        self._snapshot = {ch: self._reading_value(reading) for ch, reading in zip(self._scan_channels, readings)}
+        self._snapshot_cal = {ch: values_cal[0] for ch, values_cal in
+                              self._calibrate_scan({ch: [raw] for ch, raw in self._snapshot.items()}).items()}
+        self._snapshot_time = time.monotonic()
+        logger.debug(f'scan snapshot: {self._snapshot}')
 
 
 __all__.append('MuxerGetEntity')
-class MuxerGetEntity(Entity):
+class MuxerGetEntity(BoundCalibrationMixin, Entity):
     '''
     Entity for communication with muxer endpoints.  No set functionality.
     '''
@@ -294,24 +483,36 @@ class MuxerGetEntity(Entity):
     def __init__(self,
                  ch_number,
                  conf_str=None,
+                 max_age=None,
                  **kwargs):
         '''
         ch_number (int): channel number for endpoint
         conf_str (str): used by MuxerService to configure endpoint scan
+        max_age (float): maximum age in seconds of a scan snapshot reading, defaults to the service's snapshot_max_age
         '''
         Entity.__init__(self, **kwargs)
         if conf_str is None:
             raise ThrowReply('service_error_invalid_value',
                             f'<conf_str> required for MuxerGetEntity {self.name}')
+        self._bind_calibration(_calibrations)
         self.get_str = "DATA:LAST? (@{})".format(ch_number)
         self.ch_number = ch_number
+        self.conf_template = conf_str
         self.conf_str = conf_str.format(ch_number)
+        self.max_age = max_age
 
-    @calibrate(_all_calibrations)
+    @single_flight
     def on_get(self):
-        result = self.service.send_to_device([self.get_str.format(self.ch_number)])
-        logger.debug('very raw is: {}'.format(result))
-        return result.split()[0]
+        value_raw, value_cal = self.service.channel_reading(self.ch_number, self.max_age)
+        logger.debug('very raw is: {}'.format(value_raw))
+        if value_cal is not None:
+            # already calibrated along with the rest of the scan
+            return {'value_raw': value_raw, 'value_cal': value_cal}
+        return self._calibrate_reading(value_raw)
+
+    @calibrate_bound(_calibrations)
+    def _calibrate_reading(self, value_raw):
+        return value_raw
 
     def on_set(self, value):
         raise ThrowReply('message_error_invalid_method',
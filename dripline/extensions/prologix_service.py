@@ -1,69 +1,241 @@
 from dripline.core import ThrowReply, MsgReply, Service 
+from dripline.implementations.entity_endpoints import FormatEntity
 from _dripline.core import MsgRequest, Receiver, op_t
+from sagebrush.functions import CachedGetMixin, cached_get
 import scarab
+import contextlib
 import logging
 import sys
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
-__all__ = ['SagPrologixService']
+__all__ = ['SagPrologixService', 'SagPrologixEntity']
+
+class _PrologixAdapter(object):
+    '''
+    State of one Prologix adapter, shared by every SagPrologixService in this process which reaches it
+    through the same repeat_routing_key
+    '''
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.addr = None
+        self.verified = None
+        # set once any service on the adapter tracks its address; exchanges are then serialized
+        self.tracked = False
+        self._queue_ready = threading.Condition()
+        self._pending = []
+        self._dispatcher = None
+
+    def schedule(self, service, cmd, window_s):
+        '''
+        Queues cmd for service and returns its reply as soon as it has been sent.  The adapter's
+        dispatcher thread waits until the oldest queued request is window_s old, so that others can
+        join it, then sends everything queued grouped by GPIB address (see _in_address_order); requests
+        arriving during a round go in the next one, so no request waits for more than one round.
+        '''
+        request = _PendingRequest(service, cmd, window_s)
+        with self._queue_ready:
+            self._pending.append(request)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name='PrologixDispatcher', daemon=True)
+                self._dispatcher.start()
+            self._queue_ready.notify()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _dispatch(self):
+        while True:
+            with self._queue_ready:
+                while not self._pending:
+                    self._queue_ready.wait()
+                oldest = self._pending[0]
+            # requests left over from the previous round have already waited their window
+            wait = oldest.window_s - (time.monotonic() - oldest.queued)
+            if wait > 0:
+                time.sleep(wait)
+            with self._queue_ready:
+                batch, self._pending = self._pending, []
+            for request in self._in_address_order(batch):
+                try:
+                    request.result = request.service._send_now(request.cmd)
+                except Exception as err:
+                    request.error = err
+                request.done.set()
+
+    def _in_address_order(self, batch):
+        '''
+        Requests grouped by address (in arrival order within an address), starting with the address the
+        adapter is on and sweeping upward through the others, wrapping around
+        '''
+        by_addr = {}
+        for request in batch:
+            by_addr.setdefault(request.service.addr, []).append(request)
+        addrs = sorted(by_addr)
+        if self.addr is not None:
+            addrs = [a for a in addrs if a >= self.addr] + [a for a in addrs if a < self.addr]
+        return [request for a in addrs for request in by_addr[a]]
+
+
+class _PendingRequest(object):
+    def __init__(self, service, cmd, window_s):
+        self.service = service
+        self.cmd = cmd
+        self.window_s = window_s
+        self.queued = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+_adapters = {}
+_adapters_lock = threading.Lock()
+
+def _adapter_for(routing_key):
+    with _adapters_lock:
+        return _adapters.setdefault(routing_key, _PrologixAdapter())
+
 
 class SagPrologixService(Service):
-    def __init__(self, address, routing, message_wait_ms = 2000,response_terminator=None, **kwargs):
+    def __init__(self, address, routing, message_wait_ms = 2000,response_terminator=None, track_address=False, address_resync_s=60, group_window_ms=0, **kwargs):
+        '''
+        address (int): GPIB address of the instrument
+        routing (str): routing key of the repeater service which talks to the Prologix
+        message_wait_ms (int): time to wait for the repeater's reply
+        response_terminator (str): trimmed from the end of the address read back and of the reply
+        track_address (bool): if True, only switch (and verify) the adapter's address when it is not
+            already on this instrument's; only valid when every service using the adapter runs in this process
+        address_resync_s (float): with track_address, re-switch and verify the address at least this often
+        group_window_ms (float): if positive, requests go through the adapter's scheduler, which collects
+            requests from all services on the adapter for this long and sends them grouped by address;
+            best combined with track_address
+        '''
         Service.__init__(self, **kwargs)
         self.addr = address 
         self.repeat_routing_key = routing
         self._message_wait_ms = message_wait_ms
         self.response_terminator = response_terminator
+        self.track_address = track_address
+        self.address_resync_s = address_resync_s
+        self.group_window_ms = group_window_ms
+        self._adapter = _adapter_for(routing)
+        self._adapter.tracked = self._adapter.tracked or track_address
+        # one receiver serves every request; each waits on its own reply package, so several
+        # requests can be outstanding at the repeater at once
+        self._receiver = Receiver()
+        self._sig_handler = scarab.SignalHandler()
+        self._sig_handler.add_cancelable(self._receiver)
+        self._timing_lock = threading.Lock()
+        self._timing = {phase: [0, 0., 0.] for phase in ('send', 'wait', 'parse')}
 
     def send_to_device(self, cmd, **kwargs):
         cmd = cmd[0]
-        # Construct the full GPIB command
-        to_send = [f'++addr {self.addr}\r++addr', cmd]
+        if self.group_window_ms > 0:
+            return self._adapter.schedule(self, cmd, self.group_window_ms / 1000.)
+        return self._send_now(cmd)
+
+    def _send_now(self, cmd):
+        adapter = self._adapter
+        # without address tracking each message carries its own ++addr and needs no exclusion
+        with adapter.lock if adapter.tracked else contextlib.nullcontext():
+            switch = (not self.track_address or adapter.addr != self.addr or
+                      time.monotonic() - adapter.verified > self.address_resync_s)
+            # Construct the full GPIB command
+            to_send = [f'++addr {self.addr}\r++addr', cmd] if switch else [cmd]
+            try:
+                response = self._exchange(to_send)
+                parse_start = time.perf_counter()
+                if switch:
+                    result_str = self._check_address(response)
+                    adapter.addr = self.addr
+                    adapter.verified = time.monotonic()
+                else:
+                    result_str = self._trim(response)
+            except Exception:
+                # the adapter may be on any address now
+                adapter.addr = None
+                raise
+            self._record_timing('parse', time.perf_counter() - parse_start)
+
+        logger.debug(f"instrument got back: {result_str}")
+        return result_str
+
+    def _exchange(self, to_send):
+        '''
+        Sends the list of commands through the repeater and returns its reply as a string
+        '''
         payload = {'commands': to_send}
 
         # Create message request
         request = MsgRequest.create(scarab.to_param(payload), op_t.cmd, self.repeat_routing_key,specifier='send_to_device')  
 
         # Send request
-        receiver = Receiver()
+        send_start = time.perf_counter()
         reply_pkg = self.send(request)
         if not reply_pkg.successful_send:
             raise ThrowReply("Failed to send command to Prologix GPIB device.")
 
         # Handle response
-        sig_handler = scarab.SignalHandler()
-        sig_handler.add_cancelable(receiver)
-        result = receiver.wait_for_reply(reply_pkg, self._message_wait_ms)  # timeout in ms
-        sig_handler.remove_cancelable(receiver)
+        wait_start = time.perf_counter()
+        result = self._receiver.wait_for_reply(reply_pkg, self._message_wait_ms)  # timeout in ms
+        self._record_timing('send', wait_start - send_start)
+        self._record_timing('wait', time.perf_counter() - wait_start)
+        reply_id = getattr(result, 'correlation_id', None)
+        if reply_id is not None and reply_id != request.correlation_id:
+            raise ThrowReply('resource_error', f"Reply {reply_id} does not match request {request.correlation_id}")
 
         #logger.debug(f"raw result:\n{(result)}\n response {response}")
-        response = str(getattr(result,'payload'))
-
-        # Split and process
+        return str(getattr(result,'payload'))
+
+    def _record_timing(self, phase, seconds):
+        with self._timing_lock:
+            this_phase = self._timing[phase]
+            this_phase[0] += 1
+            this_phase[1] += seconds
+            this_phase[2] = max(this_phase[2], seconds)
+
+    @property
+    def timing(self):
+        '''
+        Number of requests, and mean and maximum milliseconds, spent sending to the repeater, waiting
+        for its reply, and parsing the reply
+        '''
+        with self._timing_lock:
+            return {phase: {'count': count, 'mean_ms': 1e3 * total / count if count else None, 'max_ms': 1e3 * longest}
+                    for phase, (count, total, longest) in self._timing.items()}
+
+    def reset_timing(self):
+        with self._timing_lock:
+            self._timing = {phase: [0, 0., 0.] for phase in self._timing}
+
+    def _trim(self, a_string):
+        if self.response_terminator and a_string.endswith(self.response_terminator):
+            return a_string[:-len(self.response_terminator)]
+        return a_string
+
+    def _check_address(self, response):
+        '''
+        Splits the reply to [++addr, cmd] and checks the address the adapter read back
+        '''
         split_result=response.split(";")
-        addr = split_result[0]
-        result_str = split_result[1]
         logger.debug(f'{split_result}')
-
         # Trim terminators
-        if self.response_terminator:
-            if addr.endswith(self.response_terminator):
-                addr = addr[:-len(self.response_terminator)]
-                logger.debug(f"GPIB address check trimmed to {addr}")
-            if result_str.endswith(self.response_terminator):
-                result_str = result_str[:-len(self.response_terminator)]
-                logger.debug(f"result trimmed to {result_str}")
+        addr = self._trim(split_result[0])
+        result_str = self._trim(split_result[1])
 
         # Address mismatch check
         if int(addr) != self.addr:
             raise ThrowReply("Unable to set GPIB address at Prologix")
-
-        logger.debug(f"instrument got back: {result_str}")
         return result_str
 
 
-
-
-
-
+class SagPrologixEntity(CachedGetMixin, FormatEntity):
+    '''
+    FormatEntity for instruments behind the Prologix GPIB bridge, whose reads take hundreds of ms,
+    with an opt-in cache of the last value (see CachedGetMixin).
+    '''
+    @cached_get
+    def on_get(self):
+        return FormatEntity.on_get(self)
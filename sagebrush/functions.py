@@ -1,42 +1,734 @@
 import logging
 logger = logging.getLogger(__name__)
+import bisect
+import datetime
+import functools
+import glob
 import math
+import os
+import re
+import threading
+import time
 import numpy as np
 
+from dripline.core import ThrowReply, calibrate
+
 #lin-log is log(x)
 #log-lin is log(y)
 
 __all__ = []
 
+__all__.append('CalibrationDiagnostics')
+class CalibrationDiagnostics(object):
+    '''
+    Counters for the readings a calibration had to extrapolate ('below', 'above' its table) or
+    could not take the log of ('invalid'), with rate-limited logging.
+
+    The first reading of each kind is logged right away; after that, at most one summary per
+    report_interval (count and min/max raw value since the last report) is logged, so a sensor
+    parked off the end of its table does not produce a warning on every scan.
+    '''
+    messages = {
+        'below': 'raw value below the calibration range, extrapolating',
+        'above': 'raw value above the calibration range, extrapolating',
+        'invalid': 'invalid value for a log function',
+    }
+
+    def __init__(self, name, report_interval=600.):
+        '''
+        name (str): calibration name, for the log messages
+        report_interval (float): minimum number of seconds between summaries of each kind
+        '''
+        self.name = name
+        self.report_interval = report_interval
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def record(self, kind, raw_value):
+        self._record(kind, 1, raw_value, raw_value)
+
+    def record_many(self, kind, raw_values):
+        self._record(kind, len(raw_values), float(np.min(raw_values)), float(np.max(raw_values)))
+
+    def _record(self, kind, count, low, high):
+        now = time.time()
+        with self._lock:
+            counter = self._counters.get(kind)
+            if counter is None:
+                self._counters[kind] = {'count': count, 'first_time': now, 'first_value': low, 'last_time': now,
+                                        'window_start': now, 'window_count': 0, 'window_min': None, 'window_max': None}
+                logger.warning(f"calibration <{self.name}>: {self.messages[kind]} ({count} reading(s), raw {low:g}); "
+                               f"further occurrences are summarized every {self.report_interval:g} s")
+                return
+            counter['count'] += count
+            counter['last_time'] = now
+            counter['window_count'] += count
+            counter['window_min'] = low if counter['window_min'] is None else min(low, counter['window_min'])
+            counter['window_max'] = high if counter['window_max'] is None else max(high, counter['window_max'])
+            if now - counter['window_start'] >= self.report_interval:
+                logger.warning(f"calibration <{self.name}>: {self.messages[kind]} for {counter['window_count']} reading(s) "
+                               f"in the last {now - counter['window_start']:.0f} s, raw values {counter['window_min']:g} to {counter['window_max']:g}")
+                counter.update(window_start=now, window_count=0, window_min=None, window_max=None)
+
+    def summary(self):
+        '''
+        Returns {kind: {count, first_time, first_value, last_time, window_start, window_count, window_min, window_max}}
+        for each kind seen so far; times are unix timestamps and the window is the one since the last report.
+        '''
+        with self._lock:
+            return {kind: dict(counter) for kind, counter in self._counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+__all__.append('CalibrationCurve')
+class CalibrationCurve(object):
+    '''
+    Piecewise linear calibration table, optionally in log(x) and/or log(y).
+
+    The table is sorted and transformed once when the curve is built; calling the curve
+    locates the bracketing segment with a binary search and interpolates (or extrapolates
+    from the end segments when outside of the table). Curves built with lut_points instead
+    index directly into a uniformly resampled copy of the table for in-range readings, and
+    curves built with interpolation='pchip' use a monotone cubic between the table points.
+    '''
+
+    def __init__(self, values_x=None, values_y=None, log_x=False, log_y=False, abs_x=False, name=None, doc=None, table_file=None, lut_points=None, interpolation='linear'):
+        '''
+        values_x (list): raw values of the calibration points
+        values_y (list): calibrated values of the calibration points
+        log_x (bool): interpolate in log(x)
+        log_y (bool): interpolate in log(y)
+        abs_x (bool): calibrate abs(raw value), as for the muxer resistance readings
+        name (str): name of the calibration as used in endpoint configurations
+        doc (str): description of the calibration
+        table_file (str): path to a .npy calibration table (see save_calibration_table) to read on first use, in place of values_x and values_y
+        lut_points (int): if set, also resample the table onto this many points uniformly spaced in (log) x and
+            convert in-range readings with a direct index into that grid; lut_max_deviation reports the cost
+        interpolation (str): 'linear', or 'pchip' for a monotone piecewise cubic (Fritsch-Carlson, as
+            scipy.interpolate.PchipInterpolator) through the table points; both extrapolate linearly
+        '''
+        self.log_x = log_x
+        self.log_y = log_y
+        self.abs_x = abs_x
+        if interpolation not in ('linear', 'pchip'):
+            raise ValueError(f'calibration <{name}> has unknown interpolation <{interpolation}>')
+        if interpolation == 'pchip' and lut_points is not None:
+            raise ValueError(f'calibration <{name}>: lut_points is only supported with linear interpolation')
+        self.interpolation = interpolation
+        self.diagnostics = CalibrationDiagnostics(name)
+        self.__name__ = name
+        self.__doc__ = doc
+        self.table_file = table_file
+        self.lut_points = lut_points
+        self.lut_max_deviation = None
+        self._lut_y = None
+        self._inverse = None
+        self._x = None
+        if table_file is None:
+            self._set_table(values_x, values_y)
+        elif values_x is not None or values_y is not None:
+            raise ValueError(f'calibration <{name}> takes either values_x and values_y or a table_file, not both')
+
+    def load(self):
+        '''
+        Read and validate a table_file curve now rather than on its first use; returns the curve
+        '''
+        if self._x is None:
+            self._load_table()
+        return self
+
+    def _load_table(self):
+        logger.debug(f"loading calibration table {self.table_file}")
+        table = np.load(self.table_file, mmap_mode='r')
+        self._set_table(table[0], table[1])
+
+    def _set_table(self, values_x, values_y):
+        '''
+        Validate and normalize the table, then precompute everything needed for lookups.
+
+        Points are sorted by raw value and exact repeats are dropped; tables which cannot be
+        used (mismatched lengths, non-finite values, non-positive values under a log, one raw
+        value with two calibrated values) raise ValueError. Anything else worth a look ends up
+        in self.issues, and a table whose calibrated values are not monotonic is also logged
+        as a warning and has self.monotonic = False.
+        '''
+        name = self.__name__
+        if len(values_x) != len(values_y):
+            raise ValueError(f'calibration <{name}> has {len(values_x)} x values but {len(values_y)} y values')
+        xs = np.asarray(values_x, dtype=float)
+        ys = np.asarray(values_y, dtype=float)
+        if not (np.isfinite(xs).all() and np.isfinite(ys).all()):
+            raise ValueError(f'calibration <{name}> contains non-finite values')
+        if self.log_x and (xs <= 0).any():
+            raise ValueError(f'calibration <{name}> has raw values <= 0 but log_x is set')
+        if self.log_y and (ys <= 0).any():
+            raise ValueError(f'calibration <{name}> has calibrated values <= 0 but log_y is set')
+
+        self.issues = []
+        if (np.diff(xs) < 0).any():
+            self.issues.append('points were not in ascending order of raw value and have been sorted')
+            order = np.argsort(xs, kind='stable')
+            xs = xs[order]
+            ys = ys[order]
+        repeated = np.diff(xs) == 0
+        if repeated.any():
+            if (np.diff(ys)[repeated] != 0).any():
+                raise ValueError(f'calibration <{name}> has different calibrated values for the same raw value')
+            keep = np.concatenate(([True], ~repeated))
+            xs = xs[keep]
+            ys = ys[keep]
+            self.issues.append(f'{np.count_nonzero(repeated)} repeated points were removed')
+        if len(xs) < 2:
+            raise ValueError(f'calibration <{name}> requires at least two distinct points')
+        steps = np.diff(ys)
+        self.monotonic = bool((steps >= 0).all() or (steps <= 0).all())
+        if not self.monotonic:
+            self.issues.append('calibrated values are not monotonic in the raw value')
+            logger.warning(f'calibration <{name}> is not monotonic; readings near the turning points are ambiguous')
+        for an_issue in self.issues:
+            logger.debug(f'calibration <{name}>: {an_issue}')
+
+        self.values_x = xs
+        self.values_y = ys
+        if self.log_x:
+            xs = np.log(xs)
+        if self.log_y:
+            ys = np.log(ys)
+        slopes = np.diff(ys) / np.diff(xs)
+        # arrays for evaluate(); plain lists keep the scalar path in bisect/float arithmetic
+        self._x_array = xs
+        self._y_array = ys
+        self._slopes_array = slopes
+        self._y = ys.tolist()
+        self._slopes = slopes.tolist()
+        if self.interpolation == 'pchip':
+            self._build_pchip()
+        if self.lut_points is not None:
+            self._build_lut()
+        self._x = xs.tolist()
+
+    def _build_lut(self):
+        '''
+        Resample the table onto a uniform grid in the interpolation space.
+
+        Both the table and the resampled grid are piecewise linear and agree at the grid nodes,
+        so their largest difference is at one of the table's own points; lut_max_deviation is
+        that difference, in log(y) for log_y curves (i.e. a bound on the relative error).
+        '''
+        if self.lut_points < 2:
+            raise ValueError(f'calibration <{self.__name__}> requires lut_points >= 2')
+        x_low = self._x_array[0]
+        x_high = self._x_array[-1]
+        grid = np.linspace(x_low, x_high, self.lut_points)
+        grid_y = self._interpolate_table(grid)
+        self._lut_x_low = float(x_low)
+        self._lut_x_high = float(x_high)
+        self._lut_step = float(grid[1] - grid[0])
+        self._lut_scale = 1. / self._lut_step
+        self._lut_y_array = grid_y
+        self._lut_slopes_array = np.diff(grid_y) * self._lut_scale
+        self._lut_y = grid_y.tolist()
+        self._lut_slopes = self._lut_slopes_array.tolist()
+        self.lut_max_deviation = float(np.max(np.abs(self._interpolate_lut(self._x_array) - self._y_array)))
+        logger.debug(f"calibration <{self.__name__}> lookup table of {self.lut_points} points, max deviation {self.lut_max_deviation:.3g}")
+
+    def _build_pchip(self):
+        '''
+        Compute the cubic coefficients of each segment, such that within segment k
+        y = y[k] + t * (c1[k] + t * (c2[k] + t * c3[k])) with t = x - x[k]
+        '''
+        h = np.diff(self._x_array)
+        delta = self._slopes_array
+        d = np.empty(len(self._x_array))
+        if len(h) == 1:
+            d[:] = delta[0]
+        else:
+            # interior derivatives: weighted harmonic mean of the neighbouring secants, 0 at extrema
+            w1 = 2 * h[1:] + h[:-1]
+            w2 = h[1:] + 2 * h[:-1]
+            same_sign = delta[:-1] * delta[1:] > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                d[1:-1] = np.where(same_sign, (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:]), 0.)
+            d[0] = self._pchip_edge(h[0], h[1], delta[0], delta[1])
+            d[-1] = self._pchip_edge(h[-1], h[-2], delta[-1], delta[-2])
+        c1 = d[:-1]
+        c2 = (3 * delta - 2 * d[:-1] - d[1:]) / h
+        c3 = (d[:-1] + d[1:] - 2 * delta) / h**2
+        self._pchip_arrays = (c1, c2, c3)
+        self._pchip = list(zip(c1.tolist(), c2.tolist(), c3.tolist()))
+
+    @staticmethod
+    def _pchip_edge(h0, h1, delta0, delta1):
+        # one-sided three-point derivative, limited to keep the end segment monotone
+        d = ((2 * h0 + h1) * delta0 - h0 * delta1) / (h0 + h1)
+        if np.sign(d) != np.sign(delta0):
+            return 0.
+        if np.sign(delta0) != np.sign(delta1) and abs(d) > abs(3 * delta0):
+            return 3 * delta0
+        return d
+
+    def _interpolate_table(self, these_x):
+        index = np.searchsorted(self._x_array, these_x, side='right') - 1
+        index = np.clip(index, 0, len(self._slopes_array) - 1)
+        offset = these_x - self._x_array[index]
+        linear = self._y_array[index] + self._slopes_array[index] * offset
+        if self.interpolation == 'linear':
+            return linear
+        c1, c2, c3 = self._pchip_arrays
+        cubic = self._y_array[index] + offset * (c1[index] + offset * (c2[index] + offset * c3[index]))
+        return np.where((these_x < self._x_array[0]) | (these_x > self._x_array[-1]), linear, cubic)
+
+    def _interpolate_lut(self, these_x):
+        offset = these_x - self._lut_x_low
+        index = np.clip((offset * self._lut_scale).astype(int), 0, len(self._lut_slopes_array) - 1)
+        return self._lut_y_array[index] + self._lut_slopes_array[index] * (offset - index * self._lut_step)
+
+    def __repr__(self):
+        points = 'not loaded' if self._x is None else len(self._x)
+        return f'CalibrationCurve({self.__name__!r}, points={points}, log_x={self.log_x}, log_y={self.log_y}, interpolation={self.interpolation!r})'
+
+    def __call__(self, this_x):
+        if self._x is None:
+            self._load_table()
+        this_x = float(this_x)
+        if self.abs_x:
+            this_x = abs(this_x)
+        raw_x = this_x
+        if self.log_x:
+            if this_x <= 0:
+                self.diagnostics.record('invalid', raw_x)
+                return 1e9
+            this_x = math.log(this_x)
+
+        if self._lut_y is not None and self._lut_x_low <= this_x <= self._lut_x_high:
+            offset = this_x - self._lut_x_low
+            index = int(offset * self._lut_scale)
+            if index == self.lut_points - 1:
+                index -= 1
+            to_return = self._lut_y[index] + self._lut_slopes[index] * (offset - index * self._lut_step)
+            if self.log_y:
+                to_return = math.exp(to_return)
+            return to_return
+
+        index = bisect.bisect_right(self._x, this_x) - 1
+        in_range = True
+        if index < 0:
+            self.diagnostics.record('below', raw_x)
+            index = 0
+            in_range = False
+        elif index >= len(self._slopes):
+            if this_x > self._x[-1]:
+                self.diagnostics.record('above', raw_x)
+                in_range = False
+            index = len(self._slopes) - 1
+        offset = this_x - self._x[index]
+        if self.interpolation == 'pchip' and in_range:
+            c1, c2, c3 = self._pchip[index]
+            to_return = self._y[index] + offset * (c1 + offset * (c2 + offset * c3))
+        else:
+            to_return = self._y[index] + self._slopes[index] * offset
+        if self.log_y:
+            to_return = math.exp(to_return)
+        return to_return
+
+    def evaluate(self, these_x):
+        '''
+        Calibrate an array of raw values at once, with the same conventions as calling the curve.
+
+        these_x (array_like): raw values, of any shape
+        Returns an ndarray of calibrated values with the shape of these_x
+        '''
+        if self._x is None:
+            self._load_table()
+        these_x = np.asarray(these_x, dtype=float)
+        if self.abs_x:
+            these_x = np.abs(these_x)
+        invalid = None
+        raw_x = these_x
+        if self.log_x:
+            invalid = these_x <= 0
+            if invalid.any():
+                self.diagnostics.record_many('invalid', raw_x[invalid])
+                these_x = np.where(invalid, 1., these_x)
+            else:
+                invalid = None
+            these_x = np.log(these_x)
+
+        below = these_x < self._x_array[0]
+        above = these_x > self._x_array[-1]
+        if invalid is not None:
+            # already recorded as invalid, as by __call__
+            below &= ~invalid
+            above &= ~invalid
+        n_below = np.count_nonzero(below)
+        n_above = np.count_nonzero(above)
+        if n_below:
+            self.diagnostics.record_many('below', raw_x[below])
+        if n_above:
+            self.diagnostics.record_many('above', raw_x[above])
+
+        if self._lut_y is None:
+            to_return = self._interpolate_table(these_x)
+        elif n_below or n_above:
+            to_return = np.where(below | above, self._interpolate_table(these_x), self._interpolate_lut(these_x))
+        else:
+            to_return = self._interpolate_lut(these_x)
+        if self.log_y:
+            to_return = np.exp(to_return)
+        if invalid is not None:
+            to_return = np.where(invalid, 1e9, to_return)
+        return to_return
+
+    def inverse(self):
+        '''
+        The curve mapping calibrated values back to raw values, built on first use.
+
+        The inverse has the table's roles of x and y swapped (and log_x/log_y with them), so for
+        linear interpolation it is the exact inverse of this curve within the table range, and
+        it extrapolates along the same end segments. Raises ValueError if the table is not
+        strictly monotonic, as its calibrated values then do not determine a raw value.
+        '''
+        if self._inverse is None:
+            if self._x is None:
+                self._load_table()
+            steps = np.diff(self._y_array)
+            if not ((steps > 0).all() or (steps < 0).all()):
+                raise ValueError(f'calibration <{self.__name__}> is not strictly monotonic and cannot be inverted')
+            name = None if self.__name__ is None else f'{self.__name__}_inverse'
+            self._inverse = CalibrationCurve(self.values_y, self.values_x, log_x=self.log_y, log_y=self.log_x,
+                                             name=name, interpolation=self.interpolation)
+        return self._inverse
+
+    def invert(self, values):
+        '''
+        Raw value(s) corresponding to calibrated value(s), e.g. to express thresholds or setpoints in sensor units.
+
+        values (float|list): a calibrated value, or a list of them
+        Returns a float, or a list of floats for a list input
+        Raises ValueError for calibrated values which no raw value maps to (<= 0 under log_y)
+        '''
+        inverse = self.inverse()
+        if inverse.log_x:
+            # rather than the 1e9 the inverse curve returns for them, which would pass for a raw value
+            not_positive = [value for value in np.ravel(np.asarray(values, dtype=float)).tolist() if not value > 0]
+            if not_positive:
+                raise ValueError(f'calibrated value(s) {not_positive} are not positive, outside the range of <{self.__name__}>')
+        if isinstance(values, (list, tuple, np.ndarray)):
+            return inverse.evaluate(values).tolist()
+        return inverse(values)
+
+__all__.append('CalibrationTableStore')
+class CalibrationTableStore(object):
+    '''
+    Registry of the calibration tables in a directory, keyed by sensor serial.
+
+    Each <serial>.npy file (written with save_calibration_table) becomes a CalibrationCurve
+    named <serial>; the file is only memory mapped and read the first time that curve is
+    used, so adding a sensor is a matter of dropping its table in the directory.
+    '''
+
+    def __init__(self, directory, curve_options=None, **curve_kwargs):
+        '''
+        directory (str): path to the directory holding the .npy tables
+        curve_options (dict): per-serial CalibrationCurve options, {serial: {option: value}}, which
+            override curve_kwargs for that serial's curve
+        curve_kwargs: options passed to every CalibrationCurve (log_x, log_y, abs_x, lut_points, interpolation)
+        '''
+        self.directory = directory
+        self.curves = {}
+        curve_options = curve_options or {}
+        for path in sorted(glob.glob(os.path.join(directory, '*.npy'))):
+            serial = os.path.splitext(os.path.basename(path))[0]
+            options = dict(curve_kwargs, **curve_options.get(serial, {}))
+            self.curves[serial] = CalibrationCurve(name=serial, table_file=path, **options)
+        logger.debug(f"found {len(self.curves)} calibration tables in {directory}")
+
+    def __getitem__(self, serial):
+        return self.curves[serial]
+
+    def __contains__(self, serial):
+        return serial in self.curves
+
+    def __iter__(self):
+        return iter(self.curves.values())
+
+    def __len__(self):
+        return len(self.curves)
+
+
+__all__.append('CalibrationRegistry')
+class CalibrationRegistry(dict):
+    '''
+    Mapping of calibration name to calibration (CalibrationCurve or plain function).
+
+    Entities resolve their configured calibration against the registry once, at construction,
+    and calibrate_bound then calls that calibration directly on every get.
+    '''
+    _name_re = re.compile(r'^\s*(\w+)\(\s*\{\}\s*\)\s*$')
+
+    def __init__(self, calibrations=()):
+        '''
+        calibrations (iterable): calibrations to register, each under its __name__
+        '''
+        dict.__init__(self)
+        for a_calibration in calibrations:
+            self.register(a_calibration)
+
+    def register(self, calibration):
+        name = calibration.__name__
+        if name in self:
+            raise ValueError(f'calibration <{name}> is already registered')
+        self[name] = calibration
+        return calibration
+
+    def resolve(self, calibration):
+        '''
+        Find the registered calibration for an endpoint's calibration configuration.
+
+        calibration (str|dict|None): the calibration as passed to the Entity
+        Returns the calibration for strings of the form "<name>({})", or None for no calibration
+        and for anything else (other expressions, dict calibrations), which is left to dripline's calibrate.
+        Raises ValueError if <name> is not registered.
+        '''
+        if not isinstance(calibration, str):
+            return None
+        match = self._name_re.match(calibration)
+        if match is None:
+            return None
+        name = match.group(1)
+        if name not in self:
+            raise ValueError(f'unknown calibration <{name}>')
+        return self[name]
+
+
+def calibrate_bound(registry):
+    '''
+    Replacement for dripline.core.calibrate(<list of calibrations>) for entities which set
+    self._bound_calibration = registry.resolve(self._calibration) in __init__.
+
+    When a calibration is bound it is called directly on the raw value; otherwise the get is
+    handed to dripline's calibrate with all of the registry's calibrations.
+    '''
+    dripline_calibrate = calibrate(list(registry.values()))
+    def calibration(fun):
+        fallback = dripline_calibrate(fun)
+        @functools.wraps(fun)
+        def wrapper(self, *args, **kwargs):
+            bound = self._bound_calibration
+            if bound is None:
+                return fallback(self, *args, **kwargs)
+            val_dict = {'value_raw': fun(self, *args, **kwargs)}
+            if val_dict['value_raw'] is None:
+                return None
+            val_dict['value_cal'] = bound(val_dict['value_raw'])
+            return val_dict
+        return wrapper
+    return calibration
+
+
+def invert_bound_calibration(entity, value):
+    '''
+    Raw value(s) for calibrated value(s) under an entity's bound calibration (see calibrate_bound),
+    raising a ThrowReply if the entity has no bound CalibrationCurve or it is not invertible.
+    '''
+    curve = entity._bound_calibration
+    if not isinstance(curve, CalibrationCurve):
+        raise ThrowReply('service_error_invalid_value', f'endpoint {entity.name} does not have an invertible calibration')
+    try:
+        return curve.invert(value)
+    except ValueError as err:
+        raise ThrowReply('service_error_invalid_value', f'{err} for endpoint {entity.name}')
+
+
+def bound_calibration_diagnostics(entity):
+    '''
+    Extrapolation/invalid reading counters (CalibrationDiagnostics.summary) of an entity's bound calibration.
+    '''
+    curve = entity._bound_calibration
+    if not isinstance(curve, CalibrationCurve):
+        return {}
+    return curve.diagnostics.summary()
+
+
+__all__.append('BoundCalibrationMixin')
+class BoundCalibrationMixin(object):
+    '''
+    Mixin for entities whose on_get is wrapped in calibrate_bound(registry): _bind_calibration resolves
+    the configured calibration once, raw_value inverts it for thresholds and setpoints, and
+    calibration_diagnostics reports the readings it had to extrapolate.
+    '''
+    def _bind_calibration(self, registry):
+        '''
+        Sets self._bound_calibration from the entity's calibration, loading and validating its table
+        now so a bad table fails at startup rather than at the first get; call after Entity.__init__
+
+        registry (CalibrationRegistry): calibrations available to the entity
+        '''
+        try:
+            self._bound_calibration = registry.resolve(self._calibration)
+            if isinstance(self._bound_calibration, CalibrationCurve):
+                self._bound_calibration.load()
+        except (ValueError, OSError) as err:
+            raise ThrowReply('service_error_invalid_value', f'{err} for {type(self).__name__} {self.name}')
+
+    def raw_value(self, value):
+        '''
+        value (float|list): calibrated value(s), e.g. thresholds; returns the corresponding raw reading(s)
+        '''
+        return invert_bound_calibration(self, value)
+
+    def calibration_diagnostics(self):
+        '''
+        Returns the counts and raw value ranges of readings the calibration had to extrapolate
+        '''
+        return bound_calibration_diagnostics(self)
+
+
+__all__.append('SingleFlight')
+class SingleFlight(object):
+    '''
+    Coalesces concurrent calls with the same key: the first caller runs the function and every
+    caller arriving while it is in flight waits for, and receives, that same result (or exception).
+    '''
+
+    class _Call(object):
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+            self.waiters = 0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, function, *args, **kwargs):
+        '''
+        key (hashable): identifies calls which may share a result
+        function (callable): called as function(*args, **kwargs) unless a call with key is already in flight
+        '''
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is None:
+                call = self._in_flight[key] = self._Call()
+                self.calls += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # dict results are handed on by the framework; don't let callers share one
+            return dict(call.result) if isinstance(call.result, dict) else call.result
+        try:
+            call.result = function(*args, **kwargs)
+        except Exception as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result
+
+
+def single_flight(fun):
+    '''
+    Decorator for an entity's on_get so that gets arriving while one is already talking to the
+    device wait for that exchange instead of queueing their own behind the service lock.
+    Apply it outside of any calibrate decorator so the calibrated result is shared too.
+    '''
+    @functools.wraps(fun)
+    def wrapper(self, *args, **kwargs):
+        flight = self.__dict__.get('_single_flight')
+        if flight is None:
+            flight = self.__dict__.setdefault('_single_flight', SingleFlight())
+        key = (fun.__name__, args, tuple(sorted(kwargs.items())))
+        return flight.do(key, fun, self, *args, **kwargs)
+    return wrapper
+
+
+def cached_get(fun):
+    '''
+    Decorator for an entity's on_get which, when the entity's cache_max_age is positive, returns
+    the last result without touching the device for cache_max_age seconds after it was read.
+    Dict results carry the UTC 'timestamp' at which the device was actually read, so a value
+    served from the cache is logged with its acquisition time.  Apply it outermost.
+    '''
+    @functools.wraps(fun)
+    def wrapper(self, *args, **kwargs):
+        max_age = getattr(self, 'cache_max_age', 0) or 0
+        if max_age <= 0:
+            return fun(self, *args, **kwargs)
+        cached = self.__dict__.get('_cached_get')
+        if cached is not None and time.monotonic() - cached[0] <= max_age:
+            return dict(cached[1]) if isinstance(cached[1], dict) else cached[1]
+        acquired = time.monotonic()
+        timestamp = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        result = fun(self, *args, **kwargs)
+        if isinstance(result, dict):
+            result = dict(result)
+            result.setdefault('timestamp', timestamp)
+        self._cached_get = (acquired, result)
+        return dict(result) if isinstance(result, dict) else result
+    return wrapper
+
+
+def refresh_cached_get(entity):
+    '''
+    Drops the entity's cached_get value and returns a fresh on_get
+    '''
+    entity.__dict__.pop('_cached_get', None)
+    return entity.on_get()
+
+
+__all__.append('CachedGetMixin')
+class CachedGetMixin(object):
+    '''
+    Mixin for entities whose on_get is wrapped in cached_get: takes the cache_max_age configuration
+    parameter and provides the refresh command.  List it before the Entity base class and initialize
+    through it, e.g. CachedGetMixin.__init__(self, **kwargs).
+    '''
+    def __init__(self, cache_max_age=0, **kwargs):
+        '''
+        cache_max_age (float): seconds a get may be served from the last reading, 0 (default) always reads the device
+        '''
+        super().__init__(**kwargs)
+        self.cache_max_age = cache_max_age
+
+    def refresh(self):
+        '''
+        Reads the device now, bypassing (and updating) the cached value
+        '''
+        return refresh_cached_get(self)
+
+
+def save_calibration_table(path, values_x, values_y):
+    '''
+    Write a calibration table in the format read by CalibrationTableStore: a float64 .npy
+    array of shape (2, n) with the raw values in row 0 and the calibrated values in row 1.
+    '''
+    np.save(path, np.array([values_x, values_y], dtype=float))
+
+
 def piecewise_cal(values_x, values_y, this_x, log_x=False, log_y=False):
-    if log_x:
-        logger.debug("doing log x cal")
-        values_x = [math.log(x) for x in values_x]
-        if this_x <= 0:
-            logger.warning("invalid value for a log function")
-            return 1e9
-        this_x = math.log(this_x)
-    if log_y:
-        logger.debug("doing log y cal")
-        values_y = [math.log(y) for y in values_y]
-
-
-    #to_return = np.interp(this_x, values_x, values_y, left = values_y[0], right = values_y[-1])
-    index = np.argmin(np.abs(np.array(values_x) - this_x) )
-    if index == len(values_x)-1:
-        logger.warning("raw value is above the calibration range, extrapolating")
-        high_index = index
-    elif index == 0:
-        high_index = 1
-        logger.warning("raw value is below the calibration range, extrapolating")
-    else:
-        diff1 = np.abs(values_x[index+1] - this_x)
-        diff2 = np.abs(values_x[index-1] - this_x)
-        if diff1 < diff2: high_index = index+1
-        else : high_index = index
-        #raise dripline.core.DriplineValueError("raw value is below calibration range")
-    m = (values_y[high_index] - values_y[high_index - 1]) / (values_x[high_index] - values_x[high_index - 1])
-    to_return = values_y[high_index - 1] + m * (this_x - values_x[high_index - 1])
-    if log_y:
-        to_return = math.exp(to_return)
-    return to_return
+    '''
+    One-off piecewise linear calibration; calibrations which are evaluated repeatedly
+    should build a CalibrationCurve once and call that instead.
+    '''
+    return CalibrationCurve(values_x, values_y, log_x=log_x, log_y=log_y)(this_x)
+
+
+def piecewise_cal_many(values_x, values_y, these_x, log_x=False, log_y=False):
+    '''
+    Array form of piecewise_cal, calibrating every element of these_x against one table.
+    '''
+    return CalibrationCurve(values_x, values_y, log_x=log_x, log_y=log_y).evaluate(these_x)